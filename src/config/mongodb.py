@@ -18,7 +18,14 @@ class MongoDB:
         for attempt in range(1, retries + 1):
             try:
                 logger.info(f"Connection attempt {attempt}/{retries} to MongoDB with URI: {env_config.MONGO_URI[:30]}...")
-                cls.client = AsyncIOMotorClient(env_config.MONGO_URI, maxPoolSize=10, minPoolSize=1)
+                cls.client = AsyncIOMotorClient(
+                    env_config.MONGO_URI,
+                    maxPoolSize=env_config.MONGO_MAX_POOL_SIZE,
+                    minPoolSize=env_config.MONGO_MIN_POOL_SIZE,
+                    maxIdleTimeMS=env_config.MONGO_MAX_IDLE_TIME_MS,
+                    waitQueueTimeoutMS=env_config.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+                    serverSelectionTimeoutMS=env_config.MONGO_SERVER_SELECTION_TIMEOUT_MS
+                )
                 cls.db = cls.client[env_config.DATABASE_NAME]
                 await cls.db.command("ping")
                 logger.info("MongoDB connected successfully")
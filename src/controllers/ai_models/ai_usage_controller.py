@@ -4,8 +4,13 @@ from src.models.ai_models.usage_history import (
     AIUsageHistory, UsageHistoryCreate, UsageHistoryResponse, 
     UsageHistoryDetail, UsageStatus
 )
+from src.services.ai_models.usage_stats_service import UsageStatsService
+from src.utils.errors import BadRequestError, NotFoundError
+from src.utils.pagination import encode_cursor, keyset_filter, keyset_sort
 from bson import ObjectId
+from pymongo import ReturnDocument
 from datetime import datetime
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,7 +35,7 @@ class AIUsageController:
             model = await models_collection.find_one({"slug": usage_data.ai_model_slug})
             
             if not model:
-                raise ValueError(f"AI Model with slug '{usage_data.ai_model_slug}' not found")
+                raise BadRequestError(f"AI Model with slug '{usage_data.ai_model_slug}' not found")
             
             # Calculate credits required
             credits_required = model.get("pricing", {}).get("credits_per_use", 1)
@@ -41,10 +46,10 @@ class AIUsageController:
             user = await users_collection.find_one(user_query)
             
             if not user:
-                raise ValueError("User not found")
+                raise BadRequestError("User not found")
             
             if user["credits"] < credits_required:
-                raise ValueError("Insufficient credits")
+                raise BadRequestError("Insufficient credits")
             
             # Create usage record
             usage_collection = await MongoDB.get_collection("ai_usage_history")
@@ -60,7 +65,7 @@ class AIUsageController:
                 status=UsageStatus.PENDING
             )
             
-            result = await usage_collection.insert_one(usage_record.dict(by_alias=True, exclude={"uid"}))
+            result = await usage_collection.insert_one(usage_record.model_dump(by_alias=True, exclude={"uid"}))
             
             # Deduct credits
             await users_collection.update_one(
@@ -77,6 +82,10 @@ class AIUsageController:
                 {"$set": {"credits_deducted": True, "started_at": datetime.utcnow()}}
             )
             
+            await UsageStatsService.record_created(
+                user_id, usage_data.ai_model_slug, UsageStatus.PENDING.value, credits_required
+            )
+            
             return str(result.inserted_id)
             
         except Exception as e:
@@ -117,10 +126,13 @@ class AIUsageController:
                 update_data["$set"] = {**update_data}
                 update_data["$addToSet"] = {"metadata": {"$each": list(metadata.items())}}
             
-            await usage_collection.update_one(
+            previous = await usage_collection.find_one_and_update(
                 {"_id": ObjectId(usage_id)},
-                {"$set": update_data}
+                {"$set": update_data},
+                projection={"user_id": 1, "ai_model_slug": 1, "status": 1, "credits_used": 1},
+                return_document=ReturnDocument.BEFORE
             )
+            await UsageStatsService.record_transition(previous, status.value)
             
         except Exception as e:
             logger.error(f"Error updating usage record: {str(e)}")
@@ -132,7 +144,8 @@ class AIUsageController:
         ai_model_slug: Optional[str] = None,
         status: Optional[UsageStatus] = None,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get user's usage history with optimized queries"""
         try:
@@ -145,9 +158,6 @@ class AIUsageController:
             if status:
                 query["status"] = status.value
             
-            # Get total count
-            total_count = await usage_collection.count_documents(query)
-            
             # Optimized projection - only get necessary fields for listing
             projection = {
                 "_id": 1,
@@ -158,14 +168,28 @@ class AIUsageController:
                 "credits_used": 1,
                 "created_at": 1,
                 "completed_at": 1,
-                "output_data": 1,  # Just to check if has_output
+                # Derive has_output server-side instead of shipping the (possibly huge) output
+                "has_output": {"$gt": [{"$ifNull": ["$output_data", {}]}, {}]},
                 "metadata": 1
             }
             
-            cursor = usage_collection.find(query, projection).sort("created_at", -1).skip(offset).limit(limit)
+            # Offset is kept for older clients; a cursor seeks straight to the next page
+            page_query = {**query, **keyset_filter("created_at", cursor)}
+            db_cursor = usage_collection.find(page_query, projection).sort(keyset_sort("created_at"))
+            if not cursor and offset:
+                db_cursor = db_cursor.skip(offset)
+            db_cursor = db_cursor.limit(limit)
+            
+            # The total count and the page are independent, so fetch them concurrently
+            total_count, usages = await asyncio.gather(
+                usage_collection.count_documents(query),
+                db_cursor.to_list(length=limit)
+            )
             
             history = []
-            async for usage in cursor:
+            last_key = None
+            for usage in usages:
+                last_key = (usage["created_at"], usage["_id"])
                 usage = self._prepare_document_data(usage)
                 
                 history.append(UsageHistoryResponse(
@@ -177,17 +201,20 @@ class AIUsageController:
                     credits_used=usage["credits_used"],
                     created_at=usage["created_at"],
                     completed_at=usage.get("completed_at"),
-                    has_output=bool(usage.get("output_data", {})),
+                    has_output=usage.get("has_output", False),
                     metadata=usage.get("metadata", {})
                 ))
             
+            next_cursor = encode_cursor(*last_key) if len(history) == limit else None
+            
             return {
                 "usage_history": history,
                 "pagination": {
                     "total": total_count,
                     "limit": limit,
                     "offset": offset,
-                    "has_more": (offset + limit) < total_count
+                    "has_more": next_cursor is not None if cursor else (offset + limit) < total_count,
+                    "next_cursor": next_cursor
                 }
             }
             
@@ -206,7 +233,7 @@ class AIUsageController:
             })
             
             if not usage:
-                raise ValueError("Usage record not found")
+                raise NotFoundError("Usage record not found")
             
             usage = self._prepare_document_data(usage)
             
@@ -233,41 +260,7 @@ class AIUsageController:
     async def get_usage_stats(self, user_id: str) -> Dict[str, Any]:
         """Get user's usage statistics"""
         try:
-            usage_collection = await MongoDB.get_collection("ai_usage_history")
-            
-            pipeline = [
-                {"$match": {"user_id": user_id}},
-                {"$group": {
-                    "_id": {
-                        "model_slug": "$ai_model_slug",
-                        "status": "$status"
-                    },
-                    "count": {"$sum": 1},
-                    "total_credits": {"$sum": "$credits_used"}
-                }},
-                {"$group": {
-                    "_id": "$_id.model_slug",
-                    "stats": {
-                        "$push": {
-                            "status": "$_id.status",
-                            "count": "$count",
-                            "credits": "$total_credits"
-                        }
-                    },
-                    "total_usage": {"$sum": "$count"},
-                    "total_credits": {"$sum": "$total_credits"}
-                }}
-            ]
-            
-            stats = {}
-            async for stat in usage_collection.aggregate(pipeline):
-                stats[stat["_id"]] = {
-                    "total_usage": stat["total_usage"],
-                    "total_credits": stat["total_credits"],
-                    "by_status": {s["status"]: {"count": s["count"], "credits": s["credits"]} for s in stat["stats"]}
-                }
-            
-            return {"usage_stats": stats}
+            return {"usage_stats": await UsageStatsService.get_stats(user_id)}
             
         except Exception as e:
             logger.error(f"Error getting usage stats: {str(e)}")
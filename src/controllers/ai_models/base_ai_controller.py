@@ -2,8 +2,10 @@ from abc import ABC, abstractmethod
 from fastapi import HTTPException, Depends, UploadFile
 from src.config.mongodb import MongoDB
 from src.middleware.auth import get_current_user
+from src.services.ai_models.usage_stats_service import UsageStatsService
 from src.models.ai_models.base_ai_model import *
 from bson import ObjectId
+from pymongo import ReturnDocument
 from typing import Dict, Any, Optional
 import logging
 
@@ -71,6 +73,7 @@ class BaseAIController(ABC):
             usage_data = {
                 "user_id": user_id,
                 "ai_model_id": str(model["_id"]),
+                "ai_model_slug": self.model_slug,
                 "ai_model_name": model["name"],
                 "request_data": request_data,
                 "response_data": {},
@@ -87,6 +90,10 @@ class BaseAIController(ABC):
                 {"$inc": {"credits": -credits_required}}
             )
             
+            await UsageStatsService.record_created(
+                user_id, self.model_slug, UsageStatus.PENDING.value, credits_required
+            )
+            
             return str(result.inserted_id)
             
         except Exception as e:
@@ -116,10 +123,13 @@ class BaseAIController(ABC):
             if error_message:
                 update_data["error_message"] = error_message
             
-            await usage_collection.update_one(
+            previous = await usage_collection.find_one_and_update(
                 {"_id": ObjectId(usage_id)},
-                {"$set": update_data}
+                {"$set": update_data},
+                projection={"user_id": 1, "ai_model_slug": 1, "status": 1, "credits_used": 1},
+                return_document=ReturnDocument.BEFORE
             )
+            await UsageStatsService.record_transition(previous, status.value)
             
         except Exception as e:
             logger.error(f"Error updating usage record: {str(e)}")
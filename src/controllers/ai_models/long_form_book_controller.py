@@ -10,6 +10,7 @@ from src.controllers.ai_models.ai_usage_controller import AIUsageController
 from src.config.mongodb import MongoDB
 from datetime import datetime
 from bson import ObjectId
+import asyncio
 import logging
 import json
 
@@ -116,7 +117,7 @@ class LongFormBookController(BaseAIController):
                 try:
                     usage_id = await self.create_usage_record(
                         user_id=current_user,
-                        request_data=book_request.dict(),
+                        request_data=book_request.model_dump(),
                         credits_required=50
                     )
                 except HTTPException as e:
@@ -654,8 +655,11 @@ class LongFormBookController(BaseAIController):
     async def duplicate_book(self, usage_id: str, current_user: str) -> Dict[str, Any]:
         """Duplicate a previous book generation with same settings"""
         try:
-            # Get original book details
-            usage_detail = await self.usage_controller.get_usage_detail(usage_id, current_user)
+            # Original book details and the credit check are independent reads
+            usage_detail, credit_info = await asyncio.gather(
+                self.usage_controller.get_usage_detail(usage_id, current_user),
+                self.check_credits(current_user)
+            )
             
             if not usage_detail.input_data:
                 return {
@@ -666,7 +670,6 @@ class LongFormBookController(BaseAIController):
                 }
             
             # Check user credits
-            credit_info = await self.check_credits(current_user)
             if not credit_info["data"]["has_sufficient_credits"]:
                 return {
                     "status": 400,
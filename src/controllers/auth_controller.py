@@ -36,7 +36,7 @@ class AuthController:
             
             hashed_password = pwd_context.hash(user_data.password)
             
-            user_dict = user_data.dict()
+            user_dict = user_data.model_dump()
             user_dict["password"] = hashed_password
             user_dict["credits"] = 150.0
             user_dict["created_at"] = datetime.utcnow()
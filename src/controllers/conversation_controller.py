@@ -7,10 +7,12 @@ from src.models.conversation import (
 from src.config.mongodb import MongoDB
 from src.middleware.auth import get_current_user
 from src.services.ai_service import AIService
+from src.utils.pagination import encode_cursor, keyset_filter, keyset_sort
+from src.utils.streaming import stream_list_response
 from pydantic import BaseModel
 from bson import ObjectId
 from bson.errors import InvalidId
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 import json
 from datetime import datetime
 
@@ -112,10 +114,11 @@ class ConversationController:
             
             return StreamingResponse(
                 generate_stream(),
-                media_type="text/plain",
+                media_type="text/event-stream",
                 headers={
                     "Cache-Control": "no-cache",
                     "Connection": "keep-alive",
+                    "X-Accel-Buffering": "no",
                     "Access-Control-Allow-Origin": "*",
                     "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
                     "Access-Control-Allow-Headers": "*",
@@ -201,10 +204,11 @@ class ConversationController:
         
         return StreamingResponse(
             generate_stream(),
-            media_type="text/plain",
+            media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
                 "Access-Control-Allow-Origin": "*",
                 "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
                 "Access-Control-Allow-Headers": "*",
@@ -215,38 +219,64 @@ class ConversationController:
         self,
         current_user: str = Depends(get_current_user),
         limit: int = 20,
-        offset: int = 0
-    ) -> ConversationListResponse:
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> StreamingResponse:
         """Get user's conversations"""
         collection = await MongoDB.get_collection("conversations")
         
-        cursor = collection.find(
-            {"user_id": current_user}
-        ).sort("updated_at", -1).skip(offset).limit(limit)
+        try:
+            query = {"user_id": current_user, **keyset_filter("updated_at", cursor)}
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        # Offset is kept for older clients; a cursor seeks straight to the next page
+        # Summaries only need the message count and last message, not the whole thread
+        projection = {
+            "user_id": 1,
+            "title": 1,
+            "category": 1,
+            "created_at": 1,
+            "updated_at": 1,
+            "message_count": {"$size": {"$ifNull": ["$messages", []]}},
+            "last_message": {"$arrayElemAt": ["$messages.content", -1]}
+        }
+        db_cursor = collection.find(query, projection).sort(keyset_sort("updated_at"))
+        if not cursor and offset:
+            db_cursor = db_cursor.skip(offset)
+        db_cursor = db_cursor.limit(limit)
         
-        conversations = []
-        async for conv in cursor:
+        page = {"next_cursor": None}
+        return await stream_list_response(
+            self._iter_conversations(db_cursor, limit, page),
+            "Conversations retrieved successfully",
+            trailer=lambda: page
+        )
+
+    async def _iter_conversations(self, db_cursor, limit: int, page: dict) -> AsyncIterator[ConversationResponse]:
+        """Yield conversation summaries as the cursor produces them"""
+        count = 0
+        last_key = None
+        async for conv in db_cursor:
+            count += 1
+            last_key = (conv["updated_at"], conv["_id"])
+            
             # Convert ObjectId to string
             conv = self._prepare_conversation_data(conv)
-            messages = conv.get("messages", [])
             
-            conversations.append(ConversationResponse(
+            yield ConversationResponse(
                 _id=conv["_id"],  # Now it's a string
                 user_id=conv["user_id"],
                 title=conv.get("title"),
                 category=conv.get("category"),
-                message_count=len(messages),
-                last_message=messages[-1]["content"] if messages else None,
+                message_count=conv["message_count"],
+                last_message=conv.get("last_message"),
                 created_at=conv["created_at"],
                 updated_at=conv["updated_at"]
-            ))
+            )
         
-        return ConversationListResponse(
-            status=200,
-            success=True,
-            message="Conversations retrieved successfully",
-            data=conversations
-        )
+        if last_key is not None and count == limit:
+            page["next_cursor"] = encode_cursor(*last_key)
 
     async def get_conversation(
         self,
@@ -9,11 +9,15 @@ from src.config.env import env_config
 from datetime import datetime, timedelta
 from jose import jwt
 import logging
+import asyncio
 import json
 import base64
 
 logger = logging.getLogger(__name__)
 
+# Shared client so Google calls reuse pooled connections instead of a fresh TLS handshake each time
+_http_client = httpx.AsyncClient(timeout=5)
+
 class GoogleAuthController:
     # Google OAuth credentials - make sure these match your Google Console settings
     GOOGLE_CLIENT_ID = env_config.GOOGLE_CLIENT_ID
@@ -51,15 +55,14 @@ class GoogleAuthController:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(token_url, data=data)
-                logger.info(f"Token exchange response status: {response.status_code}")
-                logger.info(f"Token exchange response: {response.text}")
-                
-                if response.status_code != 200:
-                    raise HTTPException(status_code=400, detail=f"Failed to exchange code for token: {response.text}")
-                
-                return response.json()
+            response = await _http_client.post(token_url, data=data)
+            logger.info(f"Token exchange response status: {response.status_code}")
+            logger.info(f"Token exchange response: {response.text}")
+            
+            if response.status_code != 200:
+                raise HTTPException(status_code=400, detail=f"Failed to exchange code for token: {response.text}")
+            
+            return response.json()
         except Exception as e:
             logger.error(f"Token exchange error: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Token exchange failed: {str(e)}")
@@ -71,14 +74,13 @@ class GoogleAuthController:
         headers = {"Authorization": f"Bearer {access_token}"}
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(user_info_url, headers=headers)
-                logger.info(f"User info response status: {response.status_code}")
-                
-                if response.status_code != 200:
-                    raise HTTPException(status_code=400, detail="Failed to get user info from Google")
-                
-                return response.json()
+            response = await _http_client.get(user_info_url, headers=headers)
+            logger.info(f"User info response status: {response.status_code}")
+            
+            if response.status_code != 200:
+                raise HTTPException(status_code=400, detail="Failed to get user info from Google")
+            
+            return response.json()
         except Exception as e:
             logger.error(f"Get user info error: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to get user info: {str(e)}")
@@ -206,8 +208,9 @@ class GoogleAuthController:
             from google.oauth2 import id_token
             from google.auth.transport import requests as google_requests
             
-            # Verify the ID token
-            idinfo = id_token.verify_oauth2_token(
+            # Verify the ID token; google-auth fetches Google's certs with blocking I/O
+            idinfo = await asyncio.to_thread(
+                id_token.verify_oauth2_token,
                 id_token_str, google_requests.Request(), GoogleAuthController.GOOGLE_CLIENT_ID
             )
             
@@ -3,15 +3,23 @@ from src.models.payment import *
 from src.config.mongodb import MongoDB
 from src.middleware.auth import get_current_user
 from src.services.payment_service import PaymentService
+from src.utils.cache import SingleFlight, TTLCache
+from src.utils.pagination import encode_cursor, keyset_filter, keyset_sort
 from pydantic import BaseModel
 from bson import ObjectId
 from bson.errors import InvalidId
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Plan listings are public and only change through create_plan/update_plan. Those
+# clear only this process's cache; other serverless instances keep theirs until it
+# expires, so the TTL matches the 60s max-age the plan routes already send
+_plans_cache = TTLCache(ttl=60)
+_plans_flight = SingleFlight()
+
 class PaymentController:
     def __init__(self):
         self.payment_service = PaymentService()
@@ -39,6 +47,16 @@ class PaymentController:
         except (ValueError, TypeError):
             return {"_id": plan_id}
 
+    async def _get_plans_by_ids(self, plan_ids, projection: Optional[dict] = None) -> Dict[str, dict]:
+        """Fetch every referenced plan in one query, keyed by string ID"""
+        plan_keys = {self._get_plan_query(plan_id)["_id"] for plan_id in plan_ids}
+        if not plan_keys:
+            return {}
+        
+        plans_collection = await MongoDB.get_collection("plans")
+        cursor = plans_collection.find({"_id": {"$in": list(plan_keys)}}, projection)
+        return {str(plan["_id"]): plan async for plan in cursor}
+
     # Plan Management
     async def create_plan(self, request: CreatePlanRequest) -> dict:
         """Create a new subscription plan"""
@@ -60,6 +78,7 @@ class PaymentController:
             
             result = await plans_collection.insert_one(plan_data)
             plan_data["_id"] = str(result.inserted_id)
+            _plans_cache.clear()
             
             return {
                 "status": 201,
@@ -74,6 +93,15 @@ class PaymentController:
 
     async def get_plans(self, status: Optional[PlanStatus] = None) -> dict:
         """Get all subscription plans"""
+        cache_key = ("all", status)
+        cached = _plans_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        return await _plans_flight.do(cache_key, lambda: self._load_plans(cache_key, status))
+
+    async def _load_plans(self, cache_key: tuple, status: Optional[PlanStatus]) -> dict:
+        """Read all plans and cache the response"""
         try:
             plans_collection = await MongoDB.get_collection("plans")
             
@@ -88,12 +116,14 @@ class PaymentController:
                 plan = self._prepare_document_data(plan)
                 plans.append(PlanResponse(**plan))
             
-            return {
+            response = {
                 "status": 200,
                 "success": True,
                 "message": "Plans retrieved successfully",
                 "data": plans
             }
+            _plans_cache.set(cache_key, response)
+            return response
             
         except Exception as e:
             logger.error(f"Error getting plans: {str(e)}")
@@ -106,6 +136,24 @@ class PaymentController:
         status: Optional[PlanStatus] = None
     ) -> dict:
         """Get plans filtered by currency and billing cycle"""
+        cache_key = ("filtered", currency, billing_cycle, status)
+        cached = _plans_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        return await _plans_flight.do(
+            cache_key,
+            lambda: self._load_filtered_plans(cache_key, currency, billing_cycle, status)
+        )
+
+    async def _load_filtered_plans(
+        self,
+        cache_key: tuple,
+        currency: Optional[Currency],
+        billing_cycle: Optional[BillingCycle],
+        status: Optional[PlanStatus]
+    ) -> dict:
+        """Read plans for one currency/billing cycle filter and cache the response"""
         try:
             plans_collection = await MongoDB.get_collection("plans")
             
@@ -131,7 +179,7 @@ class PaymentController:
                     grouped_plans[plan.name] = []
                 grouped_plans[plan.name].append(plan)
             
-            return {
+            response = {
                 "status": 200,
                 "success": True,
                 "message": "Plans retrieved successfully",
@@ -140,6 +188,8 @@ class PaymentController:
                     "grouped_plans": grouped_plans
                 }
             }
+            _plans_cache.set(cache_key, response)
+            return response
             
         except Exception as e:
             logger.error(f"Error getting filtered plans: {str(e)}")
@@ -151,7 +201,7 @@ class PaymentController:
             plans_collection = await MongoDB.get_collection("plans")
             plan_query = self._get_plan_query(plan_id)
             
-            update_data = request.dict(exclude_unset=True)
+            update_data = request.model_dump(exclude_unset=True)
             if not update_data:
                 raise HTTPException(status_code=400, detail="No fields provided for update")
             
@@ -170,6 +220,8 @@ class PaymentController:
             if result.matched_count == 0:
                 raise HTTPException(status_code=404, detail="Plan not found")
             
+            _plans_cache.clear()
+            
             updated_plan = await plans_collection.find_one(plan_query)
             updated_plan = self._prepare_document_data(updated_plan)
             
@@ -350,59 +402,88 @@ class PaymentController:
             logger.error(f"Error verifying payment: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def get_user_transactions(self, current_user: str = Depends(get_current_user), limit: int = 20, offset: int = 0) -> dict:
+    async def get_user_transactions(
+        self,
+        current_user: str = Depends(get_current_user),
+        limit: int = 20,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> dict:
         """Get user's payment transactions"""
+        transactions_collection = await MongoDB.get_collection("transactions")
+        
         try:
-            transactions_collection = await MongoDB.get_collection("transactions")
-            plans_collection = await MongoDB.get_collection("plans")
-            
-            cursor = transactions_collection.find(
-                {"user_id": current_user}
-            ).sort("created_at", -1).skip(offset).limit(limit)
-            
-            transactions = []
-            async for transaction in cursor:
-                # Get plan details
-                plan_query = self._get_plan_query(transaction["plan_id"])
-                plan = await plans_collection.find_one(plan_query)
-                plan_name = plan["name"] if plan else "Unknown Plan"
-                
-                transaction = self._prepare_document_data(transaction)
-                transactions.append(TransactionResponse(
-                    _id=transaction["_id"],
-                    plan_name=plan_name,
-                    amount=transaction["amount"],
-                    status=transaction["status"],
-                    credits_added=transaction.get("credits_added", 0),
-                    created_at=transaction["created_at"]
-                ))
-            
-            return {
-                "status": 200,
-                "success": True,
-                "message": "Transactions retrieved successfully",
-                "data": transactions
-            }
-            
-        except Exception as e:
-            logger.error(f"Error getting user transactions: {str(e)}")
-            raise HTTPException(status_code=500, detail=str(e))
+            query = {"user_id": current_user, **keyset_filter("created_at", cursor)}
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        # Offset is kept for older clients; a cursor seeks straight to the next page
+        # Only the fields the listing renders; skips gateway order and payment payloads
+        projection = {
+            "plan_id": 1,
+            "amount": 1,
+            "status": 1,
+            "credits_added": 1,
+            "created_at": 1
+        }
+        db_cursor = transactions_collection.find(query, projection).sort(keyset_sort("created_at"))
+        if not cursor and offset:
+            db_cursor = db_cursor.skip(offset)
+        db_cursor = db_cursor.limit(limit)
+        
+        transactions = await db_cursor.to_list(length=limit)
+        next_cursor = None
+        if transactions and len(transactions) == limit:
+            last = transactions[-1]
+            next_cursor = encode_cursor(last["created_at"], last["_id"])
+        
+        # Resolve plan names for the whole page in a single query
+        plans = await self._get_plans_by_ids(
+            (transaction["plan_id"] for transaction in transactions),
+            {"name": 1}
+        )
+        
+        data = []
+        for transaction in transactions:
+            plan = plans.get(str(transaction["plan_id"]))
+            plan_name = plan["name"] if plan else "Unknown Plan"
+            
+            transaction = self._prepare_document_data(transaction)
+            data.append(TransactionResponse(
+                _id=transaction["_id"],
+                plan_name=plan_name,
+                amount=transaction["amount"],
+                status=transaction["status"],
+                credits_added=transaction.get("credits_added", 0),
+                created_at=transaction["created_at"]
+            ))
+        
+        return {
+            "status": 200,
+            "success": True,
+            "message": "Transactions retrieved successfully",
+            "data": data,
+            "next_cursor": next_cursor
+        }
 
     async def get_user_subscriptions(self, current_user: str = Depends(get_current_user)) -> dict:
         """Get user's active subscriptions"""
         try:
             subscriptions_collection = await MongoDB.get_collection("subscriptions")
-            plans_collection = await MongoDB.get_collection("plans")
             
             cursor = subscriptions_collection.find(
                 {"user_id": current_user}
             ).sort("created_at", -1)
+            user_subscriptions = await cursor.to_list(length=None)
+            
+            # Resolve every referenced plan in a single query
+            plans = await self._get_plans_by_ids(
+                subscription["plan_id"] for subscription in user_subscriptions
+            )
             
             subscriptions = []
-            async for subscription in cursor:
-                # Get plan details
-                plan_query = self._get_plan_query(subscription["plan_id"])
-                plan = await plans_collection.find_one(plan_query)
+            for subscription in user_subscriptions:
+                plan = plans.get(str(subscription["plan_id"]))
                 if plan:
                     plan = self._prepare_document_data(plan)
                     plan_response = PlanResponse(**plan)
@@ -98,7 +98,7 @@ class UserController:
                 raise HTTPException(status_code=400, detail="Email already in use")
         
         # Prepare update data
-        update_data = user_data.dict(exclude_unset=True)
+        update_data = user_data.model_dump(exclude_unset=True)
         if not update_data:
             raise HTTPException(status_code=400, detail="No fields provided for update")
         
@@ -1,11 +1,13 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from src.routes.auth_routes import router as auth_router
 from src.routes.user_routes import router as user_router
 from src.routes.conversation_routes import router as conversation_router
 from src.routes.payment_routes import router as payment_router
 from src.routes.ai_models import ai_models_router
 from src.config.mongodb import MongoDB
+from src.utils.errors import BadRequestError, NotFoundError
 import logging
 
 
@@ -13,7 +15,7 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="ZenleadAI-Studio Backend")
+app = FastAPI(title="ZenleadAI-Studio Backend", default_response_class=ORJSONResponse)
 
 
 app.add_middleware(
@@ -24,6 +26,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Controllers signal bad input with BadRequestError and missing records with
+# NotFoundError; routes let both propagate and they are mapped here. Other
+# ValueErrors (pydantic, JSON decoding) are internal failures and reach the
+# fallback handler below.
+@app.exception_handler(NotFoundError)
+async def not_found_exception_handler(request: Request, exc: NotFoundError):
+    return ORJSONResponse(
+        status_code=404,
+        content={"status": 404, "success": False, "detail": str(exc)}
+    )
+
+@app.exception_handler(BadRequestError)
+async def bad_request_exception_handler(request: Request, exc: BadRequestError):
+    return ORJSONResponse(
+        status_code=400,
+        content={"status": 400, "success": False, "detail": str(exc)}
+    )
+
+# Fallback for anything a route did not turn into an HTTPException. Routes no
+# longer wrap their bodies in try/except; the error is logged here and the
+# client gets a generic message instead of the internal exception text.
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.exception(f"Unhandled error on {request.method} {request.url.path}")
+    return ORJSONResponse(
+        status_code=500,
+        content={"status": 500, "success": False, "detail": "Internal server error"}
+    )
+
 # Routers
 app.include_router(auth_router)
 app.include_router(user_router)
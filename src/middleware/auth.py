@@ -1,16 +1,34 @@
 from fastapi import HTTPException, Depends
 from fastapi.security import OAuth2PasswordBearer
 from src.config.env import env_config
+from src.utils.cache import TTLCache
 from jose import jwt, JWTError
+from hashlib import blake2b
+import time
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# Verified token subjects, keyed by a digest of the token so raw tokens are not kept
+_TOKEN_CACHE_TTL = 300
+_token_cache = TTLCache(ttl=_TOKEN_CACHE_TTL, maxsize=10_000)
+
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> str:
+    token_key = blake2b(token.encode(), digest_size=16).digest()
+    uid = _token_cache.get(token_key)
+    if uid is not None:
+        return uid
+    
     try:
         payload = jwt.decode(token, env_config.JWT_SECRET_KEY, algorithms=[env_config.JWT_ALGORITHM])
         uid: str = payload.get("sub")
         if not uid:
             raise HTTPException(status_code=401, detail="Invalid token")
+        
+        # Never serve a cached subject past the token's own expiry
+        exp = payload.get("exp")
+        ttl = _TOKEN_CACHE_TTL if exp is None else min(_TOKEN_CACHE_TTL, exp - time.time())
+        if ttl > 0:
+            _token_cache.set(token_key, uid, ttl=ttl)
         return uid
     except JWTError as e:
-        raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, Query, Depends
 from typing import Optional, Dict, Any, List
 from src.controllers.ai_models.ai_usage_controller import AIUsageController
 from src.middleware.auth import get_current_user
 from datetime import datetime
+from collections import Counter
 
 router = APIRouter()
 controller = AIUsageController()
@@ -21,36 +22,32 @@ async def get_all_user_projects(
     offset: int = Query(0, ge=0)
 ) -> Dict[str, Any]:
     """Get all user projects for sidebar management"""
-    try:
-        # Get usage history with optimized projection
-        history_data = await controller.get_user_usage_history(
-            user_id=current_user,
-            ai_model_slug=project_type,
-            limit=limit,
-            offset=offset
-        )
-        
-        projects = []
-        for usage in history_data["usage_history"]:
-            project = _format_project_for_sidebar(usage)
-            projects.append(project)
-        
-        # Group projects by type for organized display
-        projects_by_type = _group_projects_by_type(projects)
-        
-        return {
-            "status": 200,
-            "success": True,
-            "data": {
-                "projects": projects,
-                "projects_by_type": projects_by_type,
-                "pagination": history_data["pagination"],
-                "summary": _get_projects_summary(projects)
-            }
+    # Get usage history with optimized projection
+    history_data = await controller.get_user_usage_history(
+        user_id=current_user,
+        ai_model_slug=project_type,
+        limit=limit,
+        offset=offset
+    )
+
+    projects = []
+    for usage in history_data["usage_history"]:
+        project = _format_project_for_sidebar(usage)
+        projects.append(project)
+
+    # Group projects by type for organized display
+    projects_by_type = _group_projects_by_type(projects)
+
+    return {
+        "status": 200,
+        "success": True,
+        "data": {
+            "projects": projects,
+            "projects_by_type": projects_by_type,
+            "pagination": history_data["pagination"],
+            "summary": _get_projects_summary(projects)
         }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get projects: {str(e)}")
+    }
 
 def _format_project_for_sidebar(usage) -> Dict[str, Any]:
     """Format project data specifically for sidebar display"""
@@ -91,11 +88,13 @@ def _format_project_for_sidebar(usage) -> Dict[str, Any]:
 def _extract_book_metadata(usage) -> Dict[str, Any]:
     """Extract book-specific data for sidebar"""
     settings = usage.model_settings or {}
+    genre = settings.get("genre", "")
+    genre_label = settings.get("genre", "Book")
     metadata = {
         "title": settings.get("book_title", "Untitled Book"),
-        "genre": settings.get("genre", ""),
+        "genre": genre,
         "thumbnail": "📚",  # Book emoji as default
-        "subtitle": f"{settings.get('genre', 'Book')} • {settings.get('chapters_count', 0)} chapters"
+        "subtitle": f"{genre_label} • {settings.get('chapters_count', 0)} chapters"
     }
     
     # Add completed book stats
@@ -103,15 +102,17 @@ def _extract_book_metadata(usage) -> Dict[str, Any]:
         book_meta = usage.metadata.get("book_metadata", {})
         if book_meta:
             word_count = book_meta.get("total_words", 0)
-            metadata["subtitle"] = f"{word_count:,} words • {settings.get('genre', 'Book')}"
+            metadata["subtitle"] = f"{word_count:,} words • {genre_label}"
     
     return metadata
 
 def _extract_image_metadata(usage) -> Dict[str, Any]:
     """Extract image generation metadata for sidebar"""
     settings = usage.model_settings or {}
+    prompt = settings.get("prompt", "Image Generation")
     return {
-        "title": settings.get("prompt", "Image Generation")[:30] + "...",
+        # Only mark the title as truncated when it actually is
+        "title": prompt if len(prompt) <= 30 else f"{prompt[:30]}…",
         "genre": settings.get("style", ""),
         "thumbnail": "🎨",
         "subtitle": f"{settings.get('style', 'Image')} • {settings.get('size', 'Unknown')}"
@@ -130,20 +131,16 @@ def _group_projects_by_type(projects: List[Dict]) -> Dict[str, List[Dict]]:
 
 def _get_projects_summary(projects: List[Dict]) -> Dict[str, Any]:
     """Get project statistics for sidebar header"""
-    total = len(projects)
-    processing = len([p for p in projects if p["status"] == "processing"])
-    completed = len([p for p in projects if p["status"] == "completed"])
-    failed = len([p for p in projects if p["status"] == "failed"])
+    # Tally with Counters instead of building a throwaway list per figure
+    by_status = Counter(p["status"] for p in projects)
+    by_type = Counter(p["project_type"] for p in projects)
     
     return {
-        "total": total,
-        "processing": processing,
-        "completed": completed,
-        "failed": failed,
-        "by_type": {
-            project_type: len([p for p in projects if p["project_type"] == project_type])
-            for project_type in set(p["project_type"] for p in projects)
-        }
+        "total": len(projects),
+        "processing": by_status["processing"],
+        "completed": by_status["completed"],
+        "failed": by_status["failed"],
+        "by_type": dict(by_type)
     }
 
 def _get_status_color(status: str) -> str:
@@ -178,28 +175,24 @@ async def get_processing_projects(
     current_user: str = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """Get only processing projects for real-time sidebar updates"""
-    try:
-        from src.models.ai_models.usage_history import UsageStatus
-        
-        history_data = await controller.get_user_usage_history(
-            user_id=current_user,
-            status=UsageStatus.PROCESSING,
-            limit=20
-        )
-        
-        processing_projects = []
-        for usage in history_data["usage_history"]:
-            project = _format_project_for_sidebar(usage)
-            processing_projects.append(project)
-        
-        return {
-            "status": 200,
-            "success": True,
-            "data": {
-                "processing_projects": processing_projects,
-                "count": len(processing_projects)
-            }
+    from src.models.ai_models.usage_history import UsageStatus
+
+    history_data = await controller.get_user_usage_history(
+        user_id=current_user,
+        status=UsageStatus.PROCESSING,
+        limit=20
+    )
+
+    processing_projects = []
+    for usage in history_data["usage_history"]:
+        project = _format_project_for_sidebar(usage)
+        processing_projects.append(project)
+
+    return {
+        "status": 200,
+        "success": True,
+        "data": {
+            "processing_projects": processing_projects,
+            "count": len(processing_projects)
         }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get processing projects: {str(e)}")
+    }
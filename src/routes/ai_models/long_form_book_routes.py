@@ -3,6 +3,11 @@ from fastapi.responses import StreamingResponse
 from typing import Dict, Any
 from src.controllers.ai_models.long_form_book_controller import LongFormBookController
 from src.middleware.auth import get_current_user
+from datetime import datetime
+import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 controller = LongFormBookController()
@@ -43,13 +48,16 @@ async def generate_long_form_book_stream(
     """
     try:
         return await controller.process_request_stream(request, current_user)
-    except Exception as e:
-        # Return SSE error format instead of JSON
+    except Exception:
+        # Log the cause here and send the client a fixed SSE error event,
+        # since the app-level handler cannot reply in stream format
+        logger.exception("Failed to start book generation")
+
         async def error_stream():
             error_data = {
                 "type": "error",
                 "error_code": "STARTUP_ERROR",
-                "message": f"Failed to start book generation: {str(e)}",
+                "message": "Failed to start book generation",
                 "timestamp": str(datetime.utcnow())
             }
             yield f"event: error\ndata: {json.dumps(error_data)}\n\n"
@@ -81,15 +89,10 @@ async def check_user_credits(
     - has_sufficient_credits: Boolean if user can proceed
     - credits_needed: Additional credits required (if any)
     """
-    try:
-        result = await controller.check_credits(current_user)
-        if not result["success"]:
-            raise HTTPException(status_code=result["status"], detail=result["message"])
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to check credits: {str(e)}")
+    result = await controller.check_credits(current_user)
+    if not result["success"]:
+        raise HTTPException(status_code=result["status"], detail=result["message"])
+    return result
 
 @router.get(
     "/long-form-book/{usage_id}/stored",
@@ -109,15 +112,10 @@ async def get_stored_book(
     - Book metadata and statistics
     - Generation information
     """
-    try:
-        result = await controller.get_stored_book(usage_id, current_user)
-        if not result["success"]:
-            raise HTTPException(status_code=result["status"], detail=result["message"])
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve stored book: {str(e)}")
+    result = await controller.get_stored_book(usage_id, current_user)
+    if not result["success"]:
+        raise HTTPException(status_code=result["status"], detail=result["message"])
+    return result
 
 @router.get(
     "/long-form-book/{usage_id}/pdf",
@@ -144,15 +142,10 @@ async def get_book_pdf(
     link.click();
     ```
     """
-    try:
-        result = await controller.get_book_pdf(usage_id, current_user)
-        if not result["success"]:
-            raise HTTPException(status_code=result["status"], detail=result["message"])
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve PDF: {str(e)}")
+    result = await controller.get_book_pdf(usage_id, current_user)
+    if not result["success"]:
+        raise HTTPException(status_code=result["status"], detail=result["message"])
+    return result
 
 @router.get(
     "/long-form-book/{usage_id}/status",
@@ -171,15 +164,10 @@ async def get_generation_status(
     - Progress indicators
     - Error information if any
     """
-    try:
-        result = await controller.get_generation_status(usage_id, current_user)
-        if not result["success"]:
-            raise HTTPException(status_code=result["status"], detail=result["message"])
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get status: {str(e)}")
+    result = await controller.get_generation_status(usage_id, current_user)
+    if not result["success"]:
+        raise HTTPException(status_code=result["status"], detail=result["message"])
+    return result
 
 @router.post(
     "/long-form-book/{usage_id}/cancel",
@@ -197,15 +185,10 @@ async def cancel_generation(
     - Processing <5min: 50% refund (25 credits)
     - Processing >5min: No refund
     """
-    try:
-        result = await controller.cancel_generation(usage_id, current_user)
-        if not result["success"]:
-            raise HTTPException(status_code=result["status"], detail=result["message"])
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to cancel generation: {str(e)}")
+    result = await controller.cancel_generation(usage_id, current_user)
+    if not result["success"]:
+        raise HTTPException(status_code=result["status"], detail=result["message"])
+    return result
 
 @router.get(
     "/long-form-book/history",
@@ -225,15 +208,10 @@ async def get_user_book_history(
     - Credit usage statistics
     - Download availability
     """
-    try:
-        result = await controller.get_user_book_history(current_user, limit, offset)
-        if not result["success"]:
-            raise HTTPException(status_code=result["status"], detail=result["message"])
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get history: {str(e)}")
+    result = await controller.get_user_book_history(current_user, limit, offset)
+    if not result["success"]:
+        raise HTTPException(status_code=result["status"], detail=result["message"])
+    return result
 
 @router.get(
     "/long-form-book/{usage_id}/duplicate",
@@ -249,15 +227,10 @@ async def duplicate_book_settings(
     Get the original settings from a previous book generation
     to create a duplicate with the same parameters.
     """
-    try:
-        result = await controller.duplicate_book(usage_id, current_user)
-        if not result["success"]:
-            raise HTTPException(status_code=result["status"], detail=result["message"])
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get duplicate settings: {str(e)}")
+    result = await controller.duplicate_book(usage_id, current_user)
+    if not result["success"]:
+        raise HTTPException(status_code=result["status"], detail=result["message"])
+    return result
 
 # Legacy endpoints for backward compatibility
 @router.post(
@@ -278,11 +251,7 @@ async def generate_long_form_book_legacy(
     
     For real-time Server-Sent Events streaming with better user experience.
     """
-    try:
-        result = await controller.process_request(request, current_user)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to process request: {str(e)}")
+    return await controller.process_request(request, current_user)
 
 @router.get(
     "/long-form-book/{usage_id}/content",
@@ -302,15 +271,10 @@ async def get_book_content_legacy(
     
     For complete book data including images and PDF.
     """
-    try:
-        result = await controller.get_full_book_content(usage_id, current_user)
-        if not result["success"]:
-            raise HTTPException(status_code=result["status"], detail=result["message"])
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve content: {str(e)}")
+    result = await controller.get_full_book_content(usage_id, current_user)
+    if not result["success"]:
+        raise HTTPException(status_code=result["status"], detail=result["message"])
+    return result
 
 @router.get(
     "/long-form-book/settings",
@@ -371,33 +335,29 @@ async def get_book_settings() -> Dict[str, Any]:
         current_user: str = Depends(get_current_user)
     ):
         """Get full chapter content for display"""
-        try:
-            usage_detail = await controller.usage_controller.get_usage_detail(usage_id, current_user)
-            
-            if not usage_detail.output_data:
-                raise HTTPException(status_code=404, detail="Book not found")
-            
-            complete_chapters = usage_detail.output_data.get("complete_chapters", [])
-            
-            for chapter in complete_chapters:
-                if chapter["chapter_number"] == chapter_number:
-                    return {
-                        "status": 200,
-                        "success": True,
-                        "data": {
-                            "chapter_number": chapter["chapter_number"],
-                            "title": chapter["title"],
-                            "full_content": chapter["full_content"],  # FULL CONTENT
-                            "formatted_content": chapter.get("formatted_content", ""),
-                            "word_count": chapter["word_count"],
-                            "images": chapter.get("images", [])
-                        }
+        usage_detail = await controller.usage_controller.get_usage_detail(usage_id, current_user)
+        
+        if not usage_detail.output_data:
+            raise HTTPException(status_code=404, detail="Book not found")
+        
+        complete_chapters = usage_detail.output_data.get("complete_chapters", [])
+        
+        for chapter in complete_chapters:
+            if chapter["chapter_number"] == chapter_number:
+                return {
+                    "status": 200,
+                    "success": True,
+                    "data": {
+                        "chapter_number": chapter["chapter_number"],
+                        "title": chapter["title"],
+                        "full_content": chapter["full_content"],  # FULL CONTENT
+                        "formatted_content": chapter.get("formatted_content", ""),
+                        "word_count": chapter["word_count"],
+                        "images": chapter.get("images", [])
                     }
-            
-            raise HTTPException(status_code=404, detail="Chapter not found")
-            
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+                }
+        
+        raise HTTPException(status_code=404, detail="Chapter not found")
 
 
 
@@ -415,50 +375,47 @@ async def get_book_project_view(
     try:
         # Get usage detail
         usage_detail = await controller.usage_controller.get_usage_detail(usage_id, current_user)
-        
-        # Prepare project view data
-        project_data = {
-            "usage_id": usage_id,
-            "project_type": "long-form-book",
-            "project_name": "Long Form Book Generation",
-            "status": usage_detail.status.value,
-            "created_at": usage_detail.created_at,
-            "started_at": usage_detail.started_at,
-            "completed_at": usage_detail.completed_at,
-            "credits_used": usage_detail.credits_used,
-            "error_message": usage_detail.error_message,
-            
-            # Book-specific data
-            "book_data": {
-                "title": usage_detail.input_data.get("book_title", "Untitled Book"),
-                "concept": usage_detail.input_data.get("concept", ""),
-                "genre": usage_detail.input_data.get("genre", ""),
-                "settings": usage_detail.input_data
-            },
-            
-            # Navigation capabilities
-            "navigation": {
-                "can_duplicate": usage_detail.status.value == "completed",
-                "can_cancel": usage_detail.status.value in ["pending", "processing"],
-                "can_download_pdf": usage_detail.status.value == "completed",
-                "can_view_chapters": usage_detail.status.value == "completed"
-            },
-            
-            # Status-specific data
-            "status_data": _get_book_status_data(usage_detail)
-        }
-        
-        return {
-            "status": 200,
-            "success": True,
-            "message": "Book project data retrieved successfully",
-            "data": project_data
-        }
-        
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get book project: {str(e)}")
+
+    # Prepare project view data
+    project_data = {
+        "usage_id": usage_id,
+        "project_type": "long-form-book",
+        "project_name": "Long Form Book Generation",
+        "status": usage_detail.status.value,
+        "created_at": usage_detail.created_at,
+        "started_at": usage_detail.started_at,
+        "completed_at": usage_detail.completed_at,
+        "credits_used": usage_detail.credits_used,
+        "error_message": usage_detail.error_message,
+
+        # Book-specific data
+        "book_data": {
+            "title": usage_detail.input_data.get("book_title", "Untitled Book"),
+            "concept": usage_detail.input_data.get("concept", ""),
+            "genre": usage_detail.input_data.get("genre", ""),
+            "settings": usage_detail.input_data
+        },
+
+        # Navigation capabilities
+        "navigation": {
+            "can_duplicate": usage_detail.status.value == "completed",
+            "can_cancel": usage_detail.status.value in ["pending", "processing"],
+            "can_download_pdf": usage_detail.status.value == "completed",
+            "can_view_chapters": usage_detail.status.value == "completed"
+        },
+
+        # Status-specific data
+        "status_data": _get_book_status_data(usage_detail)
+    }
+
+    return {
+        "status": 200,
+        "success": True,
+        "message": "Book project data retrieved successfully",
+        "data": project_data
+    }
 
 def _get_book_status_data(usage_detail) -> Dict[str, Any]:
     """Get book-specific status data"""
@@ -500,33 +457,30 @@ async def get_real_time_dashboard(
     current_user: str = Depends(get_current_user)
 ):
     """Get real-time dashboard data for active generations"""
-    try:
-        # Get processing projects
-        processing_data = await controller.usage_controller.get_user_usage_history(
-            user_id=current_user,
-            ai_model_slug="long-form-book",
-            status="processing",
-            limit=10
-        )
-        
-        return {
-            "status": 200,
-            "success": True,
-            "data": {
-                "active_generations": len(processing_data["usage_history"]),
-                "processing_projects": [
-                    {
-                        "usage_id": usage.uid,
-                        "title": usage.input_data.get("book_title", "Untitled"),
-                        "progress": "In Progress",
-                        "started_at": usage.started_at
-                    }
-                    for usage in processing_data["usage_history"]
-                ]
-            }
+    # Get processing projects
+    processing_data = await controller.usage_controller.get_user_usage_history(
+        user_id=current_user,
+        ai_model_slug="long-form-book",
+        status="processing",
+        limit=10
+    )
+
+    return {
+        "status": 200,
+        "success": True,
+        "data": {
+            "active_generations": len(processing_data["usage_history"]),
+            "processing_projects": [
+                {
+                    "usage_id": usage.uid,
+                    "title": usage.input_data.get("book_title", "Untitled"),
+                    "progress": "In Progress",
+                    "started_at": usage.started_at
+                }
+                for usage in processing_data["usage_history"]
+            ]
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    }
 
 @router.post("/long-form-book/{usage_id}/heartbeat")
 async def heartbeat(
@@ -1,5 +1,4 @@
-from fastapi import APIRouter, Query, Request
-from fastapi.responses import RedirectResponse
+from fastapi import APIRouter, Query
 from src.models.user import UserCreate
 from src.controllers.auth_controller import AuthController, AuthResponse
 from src.controllers.google_auth_controller import GoogleAuthController
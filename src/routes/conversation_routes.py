@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from src.controllers.conversation_controller import ConversationController
 from src.models.conversation import ConversationRequest
 from src.middleware.auth import get_current_user
+from src.utils.http_cache import conditional_json_response
+from src.utils.validation import ObjectIdPath
 from pydantic import BaseModel
+from typing import Optional
 
 router = APIRouter(prefix="/api/conversation", tags=["Conversation"])
 controller = ConversationController()
@@ -20,7 +23,7 @@ async def create_conversation(
 
 @router.post("/{conversation_id}/message")
 async def continue_conversation(
-    conversation_id: str,
+    conversation_id: ObjectIdPath,
     request: ConversationRequest,
     current_user: str = Depends(get_current_user)
 ):
@@ -30,23 +33,27 @@ async def continue_conversation(
 @router.get("/")
 async def get_conversations(
     current_user: str = Depends(get_current_user),
-    limit: int = Query(default=20, le=100),
-    offset: int = Query(default=0, ge=0)
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page")
 ):
     """Get user's conversations"""
-    return await controller.get_conversations(current_user, limit, offset)
+    return await controller.get_conversations(current_user, limit, offset, cursor)
 
 @router.get("/{conversation_id}")
 async def get_conversation(
-    conversation_id: str,
+    conversation_id: ObjectIdPath,
+    http_request: Request,
     current_user: str = Depends(get_current_user)
 ):
     """Get specific conversation details"""
-    return await controller.get_conversation(conversation_id, current_user)
+    result = await controller.get_conversation(conversation_id, current_user)
+    # Revalidate on every request so new messages show up immediately
+    return conditional_json_response(http_request, result, "private, no-cache")
 
 @router.put("/{conversation_id}/title")
 async def update_conversation_title(
-    conversation_id: str,
+    conversation_id: ObjectIdPath,
     request: UpdateTitleRequest,
     current_user: str = Depends(get_current_user)
 ):
@@ -55,7 +62,7 @@ async def update_conversation_title(
 
 @router.delete("/{conversation_id}")
 async def delete_conversation(
-    conversation_id: str,
+    conversation_id: ObjectIdPath,
     current_user: str = Depends(get_current_user)
 ):
     """Delete a conversation"""
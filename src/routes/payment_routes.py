@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from src.controllers.payment_controller import PaymentController
 from src.models.payment import *
 from src.middleware.auth import get_current_user
+from src.utils.http_cache import conditional_json_response
 from typing import Optional
 
 router = APIRouter(prefix="/api/payments", tags=["Payments"])
@@ -13,19 +14,25 @@ async def create_plan(request: CreatePlanRequest):
     """Create a new subscription plan"""
     return await controller.create_plan(request)
 
+# Plans are public and change rarely, so let clients and shared caches revalidate by ETag
+PLANS_CACHE_CONTROL = "public, max-age=60"
+
 @router.get("/plans")
-async def get_plans(status: Optional[PlanStatus] = None):
+async def get_plans(http_request: Request, status: Optional[PlanStatus] = None):
     """Get all subscription plans"""
-    return await controller.get_plans(status)
+    result = await controller.get_plans(status)
+    return conditional_json_response(http_request, result, PLANS_CACHE_CONTROL)
 
 @router.get("/plans/filtered")
 async def get_filtered_plans(
+    http_request: Request,
     currency: Optional[Currency] = None,
     billing_cycle: Optional[BillingCycle] = None,
     status: Optional[PlanStatus] = None
 ):
     """Get plans filtered by currency and billing cycle"""
-    return await controller.get_plans_by_currency_and_cycle(currency, billing_cycle, status)
+    result = await controller.get_plans_by_currency_and_cycle(currency, billing_cycle, status)
+    return conditional_json_response(http_request, result, PLANS_CACHE_CONTROL)
 
 @router.put("/plans/{plan_id}")
 async def update_plan(plan_id: str, request: UpdatePlanRequest):
@@ -64,11 +71,12 @@ async def verify_payment(
 @router.get("/transactions")
 async def get_user_transactions(
     current_user: str = Depends(get_current_user),
-    limit: int = Query(default=20, le=100),
-    offset: int = Query(default=0, ge=0)
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page")
 ):
     """Get user's payment transactions"""
-    return await controller.get_user_transactions(current_user, limit, offset)
+    return await controller.get_user_transactions(current_user, limit, offset, cursor)
 
 @router.get("/subscriptions")
 async def get_user_subscriptions(
@@ -0,0 +1,87 @@
+import asyncio
+from pymongo import UpdateOne
+from src.config.mongodb import MongoDB
+from src.services.ai_models.usage_stats_service import UNKNOWN_MODEL_SLUG, UNKNOWN_STATUS
+from datetime import datetime
+
+# Per-user, per-model, per-status reduction of the whole usage history. It reads
+# every record, so expect a full collection scan
+_USAGE_STATS_PIPELINE = [
+    {"$group": {
+        "_id": {
+            "user_id": "$user_id",
+            "model_slug": {"$ifNull": ["$ai_model_slug", UNKNOWN_MODEL_SLUG]},
+            "status": {"$ifNull": ["$status", UNKNOWN_STATUS]}
+        },
+        "count": {"$sum": 1},
+        "total_credits": {"$sum": "$credits_used"}
+    }},
+    {"$group": {
+        "_id": {"user_id": "$_id.user_id", "model_slug": "$_id.model_slug"},
+        "by_status": {
+            "$push": {
+                "k": "$_id.status",
+                "v": {"count": "$count", "credits": "$total_credits"}
+            }
+        },
+        "total_usage": {"$sum": "$count"},
+        "total_credits": {"$sum": "$total_credits"}
+    }},
+    {"$group": {
+        "_id": "$_id.user_id",
+        "models": {
+            "$push": {
+                "k": "$_id.model_slug",
+                "v": {
+                    "total_usage": "$total_usage",
+                    "total_credits": "$total_credits",
+                    "by_status": {"$arrayToObject": "$by_status"}
+                }
+            }
+        }
+    }}
+]
+
+# Users written per bulk_write, so memory stays flat however many users there are
+BATCH_SIZE = 1000
+
+async def backfill_usage_stats():
+    """Build user_usage_stats from ai_usage_history
+
+    One-off migration for history written before the stats were kept
+    incrementally. Run it after setup_indexes and before deploying the API
+    that updates user_usage_stats; it overwrites each user's stats, so
+    usage created while it runs would be lost.
+    """
+    usage_collection = await MongoDB.get_collection("ai_usage_history")
+    stats_collection = await MongoDB.get_collection("user_usage_stats")
+    now = datetime.utcnow()
+
+    created = updated = 0
+    operations = []
+
+    async def flush():
+        nonlocal created, updated
+        result = await stats_collection.bulk_write(operations, ordered=False)
+        created += result.upserted_count
+        updated += result.modified_count
+        operations.clear()
+
+    async for user in usage_collection.aggregate(_USAGE_STATS_PIPELINE, allowDiskUse=True):
+        models = {model["k"]: model["v"] for model in user["models"]}
+        operations.append(UpdateOne(
+            {"user_id": user["_id"]},
+            {"$set": {"models": models, "updated_at": now}},
+            upsert=True
+        ))
+        if len(operations) >= BATCH_SIZE:
+            await flush()
+
+    if operations:
+        await flush()
+    print(f"Backfilled usage stats: {created} created, {updated} updated")
+
+    await MongoDB.close()
+
+if __name__ == "__main__":
+    asyncio.run(backfill_usage_stats())
@@ -1,4 +1,5 @@
 import asyncio
+from pymongo import UpdateOne
 from src.config.mongodb import MongoDB
 from src.utils.ai_model_registry import AI_MODELS_CONFIG
 from datetime import datetime
@@ -6,21 +7,30 @@ from datetime import datetime
 async def setup_ai_models():
     """Setup AI models in database"""
     models_collection = await MongoDB.get_collection("ai_models")
+    now = datetime.utcnow()
     
-    for slug, config in AI_MODELS_CONFIG.items():
-        existing_model = await models_collection.find_one({"slug": slug})
-        
-        if not existing_model:
-            model_data = {
+    # Insert missing models in one round trip; existing documents are left untouched
+    configs = list(AI_MODELS_CONFIG.items())
+    operations = [
+        UpdateOne(
+            {"slug": slug},
+            {"$setOnInsert": {
                 "slug": slug,
                 "status": "active",
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
+                "created_at": now,
+                "updated_at": now,
                 **config
-            }
-            
-            result = await models_collection.insert_one(model_data)
-            print(f"Created AI model: {config['name']} - ID: {result.inserted_id}")
+            }},
+            upsert=True
+        )
+        for slug, config in configs
+    ]
+    
+    result = await models_collection.bulk_write(operations, ordered=False)
+    
+    for index, (slug, config) in enumerate(configs):
+        if index in result.upserted_ids:
+            print(f"Created AI model: {config['name']} - ID: {result.upserted_ids[index]}")
         else:
             print(f"AI model already exists: {config['name']}")
 
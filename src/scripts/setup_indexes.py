@@ -0,0 +1,57 @@
+import asyncio
+from pymongo.errors import OperationFailure
+from src.config.mongodb import MongoDB
+
+# Compound indexes backing the API's list queries
+INDEXES = {
+    "ai_usage_history": [
+        [("user_id", 1), ("created_at", -1), ("_id", -1)],
+    ],
+    "conversations": [
+        [("user_id", 1), ("updated_at", -1), ("_id", -1)],
+    ],
+    "transactions": [
+        [("user_id", 1), ("created_at", -1), ("_id", -1)],
+    ],
+}
+
+# Collections holding exactly one document per user
+UNIQUE_INDEXES = {
+    "user_usage_stats": [("user_id", 1)],
+}
+
+# Indexes earlier versions created that no query uses any more; usage stats are
+# now read from user_usage_stats instead of aggregated from history
+OBSOLETE_INDEXES = {
+    "ai_usage_history": [
+        [("user_id", 1), ("ai_model_slug", 1), ("status", 1), ("credits_used", 1)],
+    ],
+}
+
+async def setup_indexes():
+    """Create the indexes used by the API's list queries"""
+    for collection_name, indexes in INDEXES.items():
+        collection = await MongoDB.get_collection(collection_name)
+        for keys in indexes:
+            name = await collection.create_index(keys)
+            print(f"Ensured index {name} on {collection_name}")
+
+    for collection_name, keys in UNIQUE_INDEXES.items():
+        collection = await MongoDB.get_collection(collection_name)
+        name = await collection.create_index(keys, unique=True)
+        print(f"Ensured unique index {name} on {collection_name}")
+
+    for collection_name, indexes in OBSOLETE_INDEXES.items():
+        collection = await MongoDB.get_collection(collection_name)
+        for keys in indexes:
+            try:
+                await collection.drop_index(keys)
+                print(f"Dropped obsolete index {keys} on {collection_name}")
+            except OperationFailure:
+                # Never created, or already dropped
+                pass
+
+    await MongoDB.close()
+
+if __name__ == "__main__":
+    asyncio.run(setup_indexes())
@@ -1,648 +1,656 @@
 import asyncio
-import sys
-import os
+import bson
+import hashlib
+import json
+import logging
 from datetime import datetime
-from typing import Dict, Any
-
-# Add the parent directory to the path so we can import our modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from bson.raw_bson import RawBSONDocument
+from pymongo import UpdateOne, WriteConcern
 
 from src.config.mongodb import MongoDB
 
+logger = logging.getLogger(__name__)
+
+# Fields written only when their content hash changes
+SCHEMA_FIELDS = ("settings_schema", "ui_layout")
+
+def _build_ui_layout(schema: Dict[str, Any], section_defs: List[Tuple[str, str, bool]]) -> Dict[str, Any]:
+    """Derive a form layout from its schema so the two cannot drift apart"""
+    return {
+        "sections": [
+            {
+                "title": title,
+                "fields": [f"{section}.{key}" for key in schema[section]],
+                # Pre-split paths so clients don't have to parse the dotted strings
+                "field_paths": [[section, key] for key in schema[section]],
+                "collapsible": collapsible
+            }
+            for title, section, collapsible in section_defs
+        ]
+    }
+
+# Static form definitions for each model; setup methods reference these rather
+# than rebuilding the nested literals on every call
+LONG_FORM_BOOK_SCHEMA = {
+    "basic_info": {
+        "concept": {
+            "type": "textarea",
+            "label": "Book Concept",
+            "description": "What book do you want to write? Describe your concept",
+            "required": True,
+            "placeholder": "e.g., Complete understanding handbook of Indian Agriculture Overview",
+            "validation": {
+                "min_length": 10,
+                "max_length": 500
+            }
+        },
+        "book_title": {
+            "type": "text",
+            "label": "Book Title",
+            "description": "Book title (auto-generated if not provided)",
+            "required": False,
+            "placeholder": "Leave blank for auto-generation"
+        },
+        "author_name": {
+            "type": "text",
+            "label": "Author Name",
+            "description": "Author name for the book",
+            "required": False,
+            "default": "AI Generated"
+        }
+    },
+    "book_properties": {
+        "genre": {
+            "type": "select",
+            "label": "Book Genre",
+            "description": "Select the book genre",
+            "required": True,
+            "options": [
+                {"value": "non-fiction", "label": "Non-Fiction"},
+                {"value": "fiction", "label": "Fiction"},
+                {"value": "educational", "label": "Educational"},
+                {"value": "business", "label": "Business"},
+                {"value": "self-help", "label": "Self Help"},
+                {"value": "children", "label": "Children"},
+                {"value": "biography", "label": "Biography"},
+                {"value": "health", "label": "Health"},
+                {"value": "technology", "label": "Technology"},
+                {"value": "history", "label": "History"}
+            ]
+        },
+        "target_audience": {
+            "type": "select",
+            "label": "Target Audience",
+            "description": "Who is this book for?",
+            "required": True,
+            "options": [
+                {"value": "general", "label": "General Public"},
+                {"value": "professionals", "label": "Professionals"},
+                {"value": "students", "label": "Students"},
+                {"value": "children", "label": "Children"},
+                {"value": "seniors", "label": "Seniors"},
+                {"value": "beginners", "label": "Beginners"},
+                {"value": "advanced-users", "label": "Advanced Users"}
+            ]
+        },
+        "book_length": {
+            "type": "select",
+            "label": "Book Length",
+            "description": "Desired book length",
+            "required": True,
+            "default": "standard",
+            "options": [
+                {"value": "short", "label": "Short (50-100 pages)"},
+                {"value": "standard", "label": "Standard (150-250 pages)"},
+                {"value": "extended", "label": "Extended (300-400 pages)"},
+                {"value": "epic", "label": "Epic (500+ pages)"}
+            ]
+        }
+    },
+    "writing_style": {
+        "tone": {
+            "type": "select",
+            "label": "Writing Tone",
+            "description": "Choose the writing style",
+            "required": True,
+            "default": "academic",
+            "options": [
+                {"value": "professional", "label": "Professional"},
+                {"value": "conversational", "label": "Conversational"},
+                {"value": "academic", "label": "Academic"},
+                {"value": "friendly", "label": "Friendly"},
+                {"value": "formal", "label": "Formal"},
+                {"value": "persuasive", "label": "Persuasive"}
+            ]
+        },
+        "complexity": {
+            "type": "select",
+            "label": "Complexity Level",
+            "description": "Content complexity level",
+            "required": True,
+            "default": "intermediate",
+            "options": [
+                {"value": "beginner", "label": "Beginner"},
+                {"value": "intermediate", "label": "Intermediate"},
+                {"value": "advanced", "label": "Advanced"}
+            ]
+        },
+        "perspective": {
+            "type": "select",
+            "label": "Writing Perspective",
+            "description": "Narrative perspective",
+            "required": True,
+            "default": "third-person",
+            "options": [
+                {"value": "first-person", "label": "First Person"},
+                {"value": "second-person", "label": "Second Person"},
+                {"value": "third-person", "label": "Third Person"}
+            ]
+        }
+    },
+    "structure": {
+        "chapters_count": {
+            "type": "range",
+            "label": "Number of Chapters",
+            "description": "How many chapters do you want?",
+            "required": True,
+            "default": 10,
+            "min": 5,
+            "max": 20,
+            "step": 1
+        },
+        "sections_per_chapter": {
+            "type": "range",
+            "label": "Sections per Chapter",
+            "description": "How many sections in each chapter?",
+            "required": True,
+            "default": 6,
+            "min": 3,
+            "max": 10,
+            "step": 1
+        },
+        "pages_per_section": {
+            "type": "range",
+            "label": "Pages per Section",
+            "description": "Approximately how many pages per section?",
+            "required": True,
+            "default": 3,
+            "min": 1,
+            "max": 8,
+            "step": 1
+        }
+    },
+    "features": {
+        "include_toc": {
+            "type": "checkbox",
+            "label": "Include Table of Contents",
+            "description": "Add a comprehensive table of contents",
+            "default": True
+        },
+        "include_images": {
+            "type": "checkbox",
+            "label": "Include Images",
+            "description": "Add relevant images throughout the book",
+            "default": True
+        },
+        "include_bibliography": {
+            "type": "checkbox",
+            "label": "Include Bibliography",
+            "description": "Add bibliography and references",
+            "default": True
+        },
+        "include_index": {
+            "type": "checkbox",
+            "label": "Include Index",
+            "description": "Add an index at the end",
+            "default": False
+        },
+        "include_cover": {
+            "type": "checkbox",
+            "label": "Include Cover Design",
+            "description": "Generate cover design information",
+            "default": True
+        }
+    }
+}
+
+LONG_FORM_BOOK_UI_LAYOUT = _build_ui_layout(LONG_FORM_BOOK_SCHEMA, [
+    ("Basic Information", "basic_info", False),
+    ("Book Properties", "book_properties", False),
+    ("Writing Style", "writing_style", True),
+    ("Book Structure", "structure", True),
+    ("Additional Features", "features", True)
+])
+
+AUDIO_TRANSLATION_SCHEMA = {
+    "audio_input": {
+        "audio_file": {
+            "type": "file",
+            "label": "Audio File",
+            "description": "Upload your audio file for translation",
+            "required": True,
+            "accept": ["audio/mp3", "audio/wav", "audio/m4a"],
+            "max_size": "50MB"
+        }
+    },
+    "translation_settings": {
+        "target_language": {
+            "type": "select",
+            "label": "Target Language",
+            "description": "Language to translate to",
+            "required": True,
+            "options": [
+                {"value": "en", "label": "English"},
+                {"value": "es", "label": "Spanish"},
+                {"value": "fr", "label": "French"},
+                {"value": "de", "label": "German"},
+                {"value": "it", "label": "Italian"},
+                {"value": "pt", "label": "Portuguese"},
+                {"value": "ru", "label": "Russian"},
+                {"value": "ja", "label": "Japanese"},
+                {"value": "ko", "label": "Korean"},
+                {"value": "zh", "label": "Chinese"},
+                {"value": "ar", "label": "Arabic"},
+                {"value": "hi", "label": "Hindi"},
+                {"value": "bn", "label": "Bengali"},
+                {"value": "ta", "label": "Tamil"},
+                {"value": "te", "label": "Telugu"},
+                {"value": "mr", "label": "Marathi"}
+            ]
+        },
+        "preserve_voice": {
+            "type": "checkbox",
+            "label": "Preserve Original Voice",
+            "description": "Maintain the original speaker's voice characteristics",
+            "default": True
+        },
+        "preserve_emotion": {
+            "type": "checkbox",
+            "label": "Preserve Emotion",
+            "description": "Keep the emotional tone of the original audio",
+            "default": True
+        }
+    },
+    "output_settings": {
+        "output_format": {
+            "type": "select",
+            "label": "Output Format",
+            "description": "Choose the output audio format",
+            "required": True,
+            "default": "mp3",
+            "options": [
+                {"value": "mp3", "label": "MP3"},
+                {"value": "wav", "label": "WAV"}
+            ]
+        },
+        "quality": {
+            "type": "select",
+            "label": "Audio Quality",
+            "description": "Select output quality",
+            "required": True,
+            "default": "high",
+            "options": [
+                {"value": "standard", "label": "Standard"},
+                {"value": "high", "label": "High"},
+                {"value": "premium", "label": "Premium"}
+            ]
+        }
+    }
+}
+
+AUDIO_TRANSLATION_UI_LAYOUT = _build_ui_layout(AUDIO_TRANSLATION_SCHEMA, [
+    ("Audio Input", "audio_input", False),
+    ("Translation Settings", "translation_settings", False),
+    ("Output Settings", "output_settings", True)
+])
+
+VOICE_CLONING_SCHEMA = {
+    "voice_input": {
+        "reference_audio": {
+            "type": "file",
+            "label": "Reference Audio",
+            "description": "Upload a clear audio sample of the voice to clone (minimum 30 seconds)",
+            "required": True,
+            "accept": ["audio/mp3", "audio/wav", "audio/m4a"],
+            "max_size": "100MB"
+        },
+        "text_content": {
+            "type": "textarea",
+            "label": "Text to Speak",
+            "description": "Enter the text you want the cloned voice to speak",
+            "required": True,
+            "validation": {
+                "min_length": 10,
+                "max_length": 5000
+            }
+        }
+    },
+    "voice_settings": {
+        "language": {
+            "type": "select",
+            "label": "Voice Language",
+            "description": "Language of the voice",
+            "required": True,
+            "options": [
+                {"value": "en-US", "label": "English (US)"},
+                {"value": "en-GB", "label": "English (UK)"},
+                {"value": "es-ES", "label": "Spanish"},
+                {"value": "fr-FR", "label": "French"},
+                {"value": "de-DE", "label": "German"},
+                {"value": "it-IT", "label": "Italian"},
+                {"value": "pt-BR", "label": "Portuguese"},
+                {"value": "hi-IN", "label": "Hindi"},
+                {"value": "ja-JP", "label": "Japanese"},
+                {"value": "ko-KR", "label": "Korean"}
+            ]
+        },
+        "tone": {
+            "type": "select",
+            "label": "Voice Tone",
+            "description": "Emotional tone for the speech",
+            "required": True,
+            "default": "neutral",
+            "options": [
+                {"value": "neutral", "label": "Neutral"},
+                {"value": "professional", "label": "Professional"},
+                {"value": "friendly", "label": "Friendly"},
+                {"value": "excited", "label": "Excited"},
+                {"value": "calm", "label": "Calm"},
+                {"value": "authoritative", "label": "Authoritative"}
+            ]
+        },
+        "speed": {
+            "type": "range",
+            "label": "Speaking Speed",
+            "description": "Adjust the speaking speed",
+            "required": True,
+            "default": 1.0,
+            "min": 0.5,
+            "max": 2.0,
+            "step": 0.1
+        },
+        "pitch": {
+            "type": "range",
+            "label": "Voice Pitch",
+            "description": "Adjust the voice pitch",
+            "required": True,
+            "default": 1.0,
+            "min": 0.5,
+            "max": 1.5,
+            "step": 0.1
+        }
+    },
+    "quality_settings": {
+        "similarity_boost": {
+            "type": "checkbox",
+            "label": "Similarity Boost",
+            "description": "Enhance voice similarity to original",
+            "default": True
+        },
+        "stability": {
+            "type": "range",
+            "label": "Voice Stability",
+            "description": "Control voice consistency",
+            "required": True,
+            "default": 0.75,
+            "min": 0.0,
+            "max": 1.0,
+            "step": 0.05
+        }
+    }
+}
+
+VOICE_CLONING_UI_LAYOUT = _build_ui_layout(VOICE_CLONING_SCHEMA, [
+    ("Voice Input", "voice_input", False),
+    ("Voice Settings", "voice_settings", False),
+    ("Quality Settings", "quality_settings", True)
+])
+
 class ModelSettingsSetup:
     """Class to handle AI model settings setup"""
     
+    # The schemas are module constants, so their encoded form never changes
+    _schema_updates: Dict[str, RawBSONDocument] = {}
+    
     def __init__(self):
         self.settings_collection = None
     
     async def initialize(self):
         """Initialize MongoDB connection"""
         await MongoDB.connect()
-        self.settings_collection = await MongoDB.get_collection("ai_model_settings")
-        print("✅ Connected to MongoDB successfully")
+        # Setup runs are idempotent and can simply be re-run, so skip waiting on the journal.
+        # Only safe for setup jobs like this one, never for API writes.
+        settings_collection = await MongoDB.get_collection("ai_model_settings")
+        self.settings_collection = settings_collection.with_options(write_concern=WriteConcern(w=1, j=False))
+        await self.settings_collection.create_index("model_slug", unique=True)
+        logger.info("✅ Connected to MongoDB successfully")
     
-    async def setup_long_form_book_settings(self):
+    def setup_long_form_book_settings(self) -> Dict[str, Any]:
         """Setup settings for long-form book model"""
-        print("🚀 Setting up Long-form Book model settings...")
+        logger.info("🚀 Setting up Long-form Book model settings...")
         
         settings_data = {
             "model_slug": "long-form-book",
             "model_name": "Long-form Book",
             "version": "1.0",
-            "settings_schema": {
-                "basic_info": {
-                    "concept": {
-                        "type": "textarea",
-                        "label": "Book Concept",
-                        "description": "What book do you want to write? Describe your concept",
-                        "required": True,
-                        "placeholder": "e.g., Complete understanding handbook of Indian Agriculture Overview",
-                        "validation": {
-                            "min_length": 10,
-                            "max_length": 500
-                        }
-                    },
-                    "book_title": {
-                        "type": "text",
-                        "label": "Book Title",
-                        "description": "Book title (auto-generated if not provided)",
-                        "required": False,
-                        "placeholder": "Leave blank for auto-generation"
-                    },
-                    "author_name": {
-                        "type": "text",
-                        "label": "Author Name",
-                        "description": "Author name for the book",
-                        "required": False,
-                        "default": "AI Generated"
-                    }
-                },
-                "book_properties": {
-                    "genre": {
-                        "type": "select",
-                        "label": "Book Genre",
-                        "description": "Select the book genre",
-                        "required": True,
-                        "options": [
-                            {"value": "non-fiction", "label": "Non-Fiction"},
-                            {"value": "fiction", "label": "Fiction"},
-                            {"value": "educational", "label": "Educational"},
-                            {"value": "business", "label": "Business"},
-                            {"value": "self-help", "label": "Self Help"},
-                            {"value": "children", "label": "Children"},
-                            {"value": "biography", "label": "Biography"},
-                            {"value": "health", "label": "Health"},
-                            {"value": "technology", "label": "Technology"},
-                            {"value": "history", "label": "History"}
-                        ]
-                    },
-                    "target_audience": {
-                        "type": "select",
-                        "label": "Target Audience",
-                        "description": "Who is this book for?",
-                        "required": True,
-                        "options": [
-                            {"value": "general", "label": "General Public"},
-                            {"value": "professionals", "label": "Professionals"},
-                            {"value": "students", "label": "Students"},
-                            {"value": "children", "label": "Children"},
-                            {"value": "seniors", "label": "Seniors"},
-                            {"value": "beginners", "label": "Beginners"},
-                            {"value": "advanced-users", "label": "Advanced Users"}
-                        ]
-                    },
-                    "book_length": {
-                        "type": "select",
-                        "label": "Book Length",
-                        "description": "Desired book length",
-                        "required": True,
-                        "default": "standard",
-                        "options": [
-                            {"value": "short", "label": "Short (50-100 pages)"},
-                            {"value": "standard", "label": "Standard (150-250 pages)"},
-                            {"value": "extended", "label": "Extended (300-400 pages)"},
-                            {"value": "epic", "label": "Epic (500+ pages)"}
-                        ]
-                    }
-                },
-                "writing_style": {
-                    "tone": {
-                        "type": "select",
-                        "label": "Writing Tone",
-                        "description": "Choose the writing style",
-                        "required": True,
-                        "default": "academic",
-                        "options": [
-                            {"value": "professional", "label": "Professional"},
-                            {"value": "conversational", "label": "Conversational"},
-                            {"value": "academic", "label": "Academic"},
-                            {"value": "friendly", "label": "Friendly"},
-                            {"value": "formal", "label": "Formal"},
-                            {"value": "persuasive", "label": "Persuasive"}
-                        ]
-                    },
-                    "complexity": {
-                        "type": "select",
-                        "label": "Complexity Level",
-                        "description": "Content complexity level",
-                        "required": True,
-                        "default": "intermediate",
-                        "options": [
-                            {"value": "beginner", "label": "Beginner"},
-                            {"value": "intermediate", "label": "Intermediate"},
-                            {"value": "advanced", "label": "Advanced"}
-                        ]
-                    },
-                    "perspective": {
-                        "type": "select",
-                        "label": "Writing Perspective",
-                        "description": "Narrative perspective",
-                        "required": True,
-                        "default": "third-person",
-                        "options": [
-                            {"value": "first-person", "label": "First Person"},
-                            {"value": "second-person", "label": "Second Person"},
-                            {"value": "third-person", "label": "Third Person"}
-                        ]
-                    }
-                },
-                "structure": {
-                    "chapters_count": {
-                        "type": "range",
-                        "label": "Number of Chapters",
-                        "description": "How many chapters do you want?",
-                        "required": True,
-                        "default": 10,
-                        "min": 5,
-                        "max": 20,
-                        "step": 1
-                    },
-                    "sections_per_chapter": {
-                        "type": "range",
-                        "label": "Sections per Chapter",
-                        "description": "How many sections in each chapter?",
-                        "required": True,
-                        "default": 6,
-                        "min": 3,
-                        "max": 10,
-                        "step": 1
-                    },
-                    "pages_per_section": {
-                        "type": "range",
-                        "label": "Pages per Section",
-                        "description": "Approximately how many pages per section?",
-                        "required": True,
-                        "default": 3,
-                        "min": 1,
-                        "max": 8,
-                        "step": 1
-                    }
-                },
-                "features": {
-                    "include_toc": {
-                        "type": "checkbox",
-                        "label": "Include Table of Contents",
-                        "description": "Add a comprehensive table of contents",
-                        "default": True
-                    },
-                    "include_images": {
-                        "type": "checkbox",
-                        "label": "Include Images",
-                        "description": "Add relevant images throughout the book",
-                        "default": True
-                    },
-                    "include_bibliography": {
-                        "type": "checkbox",
-                        "label": "Include Bibliography",
-                        "description": "Add bibliography and references",
-                        "default": True
-                    },
-                    "include_index": {
-                        "type": "checkbox",
-                        "label": "Include Index",
-                        "description": "Add an index at the end",
-                        "default": False
-                    },
-                    "include_cover": {
-                        "type": "checkbox",
-                        "label": "Include Cover Design",
-                        "description": "Generate cover design information",
-                        "default": True
-                    }
-                }
-            },
-            "ui_layout": {
-                "sections": [
-                    {
-                        "title": "Basic Information",
-                        "fields": ["basic_info.concept", "basic_info.book_title", "basic_info.author_name"],
-                        "collapsible": False
-                    },
-                    {
-                        "title": "Book Properties", 
-                        "fields": ["book_properties.genre", "book_properties.target_audience", "book_properties.book_length"],
-                        "collapsible": False
-                    },
-                    {
-                        "title": "Writing Style",
-                        "fields": ["writing_style.tone", "writing_style.complexity", "writing_style.perspective"],
-                        "collapsible": True
-                    },
-                    {
-                        "title": "Book Structure",
-                        "fields": ["structure.chapters_count", "structure.sections_per_chapter", "structure.pages_per_section"],
-                        "collapsible": True
-                    },
-                    {
-                        "title": "Additional Features",
-                        "fields": ["features.include_toc", "features.include_images", "features.include_bibliography", "features.include_index", "features.include_cover"],
-                        "collapsible": True
-                    }
-                ]
-            },
+            "settings_schema": LONG_FORM_BOOK_SCHEMA,
+            "ui_layout": LONG_FORM_BOOK_UI_LAYOUT,
             "pricing": {
                 "credits_per_use": 50,
                 "premium_credits": 75
             },
             "estimated_time": "15-30 minutes",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
             "is_active": True
         }
         
-        # Upsert the settings
-        result = await self.settings_collection.update_one(
-            {"model_slug": "long-form-book"},
-            {"$set": settings_data},
-            upsert=True
-        )
-        
-        if result.upserted_id:
-            print("✅ Long-form Book settings created successfully!")
-        else:
-            print("✅ Long-form Book settings updated successfully!")
-        
-        return True
+        return settings_data
     
-    async def setup_audio_translation_settings(self):
+    def setup_audio_translation_settings(self) -> Dict[str, Any]:
         """Setup settings for audio translation model"""
-        print("🚀 Setting up Audio Translation model settings...")
+        logger.info("🚀 Setting up Audio Translation model settings...")
         
         settings_data = {
             "model_slug": "audio-translation",
             "model_name": "Audio Translation",
             "version": "1.0",
-            "settings_schema": {
-                "audio_input": {
-                    "audio_file": {
-                        "type": "file",
-                        "label": "Audio File",
-                        "description": "Upload your audio file for translation",
-                        "required": True,
-                        "accept": ["audio/mp3", "audio/wav", "audio/m4a"],
-                        "max_size": "50MB"
-                    }
-                },
-                "translation_settings": {
-                    "target_language": {
-                        "type": "select",
-                        "label": "Target Language",
-                        "description": "Language to translate to",
-                        "required": True,
-                        "options": [
-                            {"value": "en", "label": "English"},
-                            {"value": "es", "label": "Spanish"},
-                            {"value": "fr", "label": "French"},
-                            {"value": "de", "label": "German"},
-                            {"value": "it", "label": "Italian"},
-                            {"value": "pt", "label": "Portuguese"},
-                            {"value": "ru", "label": "Russian"},
-                            {"value": "ja", "label": "Japanese"},
-                            {"value": "ko", "label": "Korean"},
-                            {"value": "zh", "label": "Chinese"},
-                            {"value": "ar", "label": "Arabic"},
-                            {"value": "hi", "label": "Hindi"},
-                            {"value": "bn", "label": "Bengali"},
-                            {"value": "ta", "label": "Tamil"},
-                            {"value": "te", "label": "Telugu"},
-                            {"value": "mr", "label": "Marathi"}
-                        ]
-                    },
-                    "preserve_voice": {
-                        "type": "checkbox",
-                        "label": "Preserve Original Voice",
-                        "description": "Maintain the original speaker's voice characteristics",
-                        "default": True
-                    },
-                    "preserve_emotion": {
-                        "type": "checkbox",
-                        "label": "Preserve Emotion",
-                        "description": "Keep the emotional tone of the original audio",
-                        "default": True
-                    }
-                },
-                "output_settings": {
-                    "output_format": {
-                        "type": "select",
-                        "label": "Output Format",
-                        "description": "Choose the output audio format",
-                        "required": True,
-                        "default": "mp3",
-                        "options": [
-                            {"value": "mp3", "label": "MP3"},
-                            {"value": "wav", "label": "WAV"}
-                        ]
-                    },
-                    "quality": {
-                        "type": "select",
-                        "label": "Audio Quality",
-                        "description": "Select output quality",
-                        "required": True,
-                        "default": "high",
-                        "options": [
-                            {"value": "standard", "label": "Standard"},
-                            {"value": "high", "label": "High"},
-                            {"value": "premium", "label": "Premium"}
-                        ]
-                    }
-                }
-            },
-            "ui_layout": {
-                "sections": [
-                    {
-                        "title": "Audio Input",
-                        "fields": ["audio_input.audio_file"],
-                        "collapsible": False
-                    },
-                    {
-                        "title": "Translation Settings",
-                        "fields": ["translation_settings.target_language", "translation_settings.preserve_voice", "translation_settings.preserve_emotion"],
-                        "collapsible": False
-                    },
-                    {
-                        "title": "Output Settings",
-                        "fields": ["output_settings.output_format", "output_settings.quality"],
-                        "collapsible": True
-                    }
-                ]
-            },
+            "settings_schema": AUDIO_TRANSLATION_SCHEMA,
+            "ui_layout": AUDIO_TRANSLATION_UI_LAYOUT,
             "pricing": {
                 "credits_per_use": 10,
                 "premium_credits": 15
             },
             "estimated_time": "2-5 minutes",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
             "is_active": True
         }
         
-        # Upsert the settings
-        result = await self.settings_collection.update_one(
-            {"model_slug": "audio-translation"},
-            {"$set": settings_data},
-            upsert=True
-        )
-        
-        if result.upserted_id:
-            print("✅ Audio Translation settings created successfully!")
-        else:
-            print("✅ Audio Translation settings updated successfully!")
-        
-        return True
+        return settings_data
     
-    async def setup_voice_cloning_settings(self):
+    def setup_voice_cloning_settings(self) -> Dict[str, Any]:
         """Setup settings for voice cloning model"""
-        print("🚀 Setting up Voice Cloning model settings...")
+        logger.info("🚀 Setting up Voice Cloning model settings...")
         
         settings_data = {
             "model_slug": "voice-cloning",
             "model_name": "Voice Cloning",
             "version": "1.0",
-            "settings_schema": {
-                "voice_input": {
-                    "reference_audio": {
-                        "type": "file",
-                        "label": "Reference Audio",
-                        "description": "Upload a clear audio sample of the voice to clone (minimum 30 seconds)",
-                        "required": True,
-                        "accept": ["audio/mp3", "audio/wav", "audio/m4a"],
-                        "max_size": "100MB"
-                    },
-                    "text_content": {
-                        "type": "textarea",
-                        "label": "Text to Speak",
-                        "description": "Enter the text you want the cloned voice to speak",
-                        "required": True,
-                        "validation": {
-                            "min_length": 10,
-                            "max_length": 5000
-                        }
-                    }
-                },
-                "voice_settings": {
-                    "language": {
-                        "type": "select",
-                        "label": "Voice Language",
-                        "description": "Language of the voice",
-                        "required": True,
-                        "options": [
-                            {"value": "en-US", "label": "English (US)"},
-                            {"value": "en-GB", "label": "English (UK)"},
-                            {"value": "es-ES", "label": "Spanish"},
-                            {"value": "fr-FR", "label": "French"},
-                            {"value": "de-DE", "label": "German"},
-                            {"value": "it-IT", "label": "Italian"},
-                            {"value": "pt-BR", "label": "Portuguese"},
-                            {"value": "hi-IN", "label": "Hindi"},
-                            {"value": "ja-JP", "label": "Japanese"},
-                            {"value": "ko-KR", "label": "Korean"}
-                        ]
-                    },
-                    "tone": {
-                        "type": "select",
-                        "label": "Voice Tone",
-                        "description": "Emotional tone for the speech",
-                        "required": True,
-                        "default": "neutral",
-                        "options": [
-                            {"value": "neutral", "label": "Neutral"},
-                            {"value": "professional", "label": "Professional"},
-                            {"value": "friendly", "label": "Friendly"},
-                            {"value": "excited", "label": "Excited"},
-                            {"value": "calm", "label": "Calm"},
-                            {"value": "authoritative", "label": "Authoritative"}
-                        ]
-                    },
-                    "speed": {
-                        "type": "range",
-                        "label": "Speaking Speed",
-                        "description": "Adjust the speaking speed",
-                        "required": True,
-                        "default": 1.0,
-                        "min": 0.5,
-                        "max": 2.0,
-                        "step": 0.1
-                    },
-                    "pitch": {
-                        "type": "range",
-                        "label": "Voice Pitch",
-                        "description": "Adjust the voice pitch",
-                        "required": True,
-                        "default": 1.0,
-                        "min": 0.5,
-                        "max": 1.5,
-                        "step": 0.1
-                    }
-                },
-                "quality_settings": {
-                    "similarity_boost": {
-                        "type": "checkbox",
-                        "label": "Similarity Boost",
-                        "description": "Enhance voice similarity to original",
-                        "default": True
-                    },
-                    "stability": {
-                        "type": "range",
-                        "label": "Voice Stability",
-                        "description": "Control voice consistency",
-                        "required": True,
-                        "default": 0.75,
-                        "min": 0.0,
-                        "max": 1.0,
-                        "step": 0.05
-                    }
-                }
-            },
-            "ui_layout": {
-                "sections": [
-                    {
-                        "title": "Voice Input",
-                        "fields": ["voice_input.reference_audio", "voice_input.text_content"],
-                        "collapsible": False
-                    },
-                    {
-                        "title": "Voice Settings",
-                        "fields": ["voice_settings.language", "voice_settings.tone", "voice_settings.speed", "voice_settings.pitch"],
-                        "collapsible": False
-                    },
-                    {
-                        "title": "Quality Settings",
-                        "fields": ["quality_settings.similarity_boost", "quality_settings.stability"],
-                        "collapsible": True
-                    }
-                ]
-            },
+            "settings_schema": VOICE_CLONING_SCHEMA,
+            "ui_layout": VOICE_CLONING_UI_LAYOUT,
             "pricing": {
                 "credits_per_use": 25,
                 "premium_credits": 35
             },
             "estimated_time": "5-10 minutes",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
             "is_active": True
         }
         
-        # Upsert the settings
-        result = await self.settings_collection.update_one(
-            {"model_slug": "voice-cloning"},
-            {"$set": settings_data},
-            upsert=True
-        )
+        return settings_data
+    
+    @staticmethod
+    def _schema_hash(schema: Dict[str, Any]) -> str:
+        """Content hash of the large, rarely changing part of a settings document"""
+        return hashlib.blake2b(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+    
+    @classmethod
+    def _schema_update(cls, slug: str, schema: Dict[str, Any]) -> RawBSONDocument:
+        """Schema $set document for a model, hashed and BSON-encoded once per process"""
+        if slug not in cls._schema_updates:
+            schema_hash = cls._schema_hash(schema)
+            cls._schema_updates[slug] = RawBSONDocument(bson.encode({**schema, "schema_hash": schema_hash}))
+        return cls._schema_updates[slug]
+    
+    async def upsert_settings(self, settings_list: List[Dict[str, Any]], now: Optional[datetime] = None):
+        """Upsert model settings documents in a single round trip"""
+        # One timestamp per run, so created_at == updated_at exactly on first insert
+        now = now or datetime.utcnow()
+        operations = []
+        
+        for settings_data in settings_list:
+            slug = settings_data["model_slug"]
+            metadata = {key: value for key, value in settings_data.items() if key not in SCHEMA_FIELDS}
+            schema = {key: settings_data[key] for key in SCHEMA_FIELDS}
+            
+            # Small mutable fields are always refreshed
+            operations.append(UpdateOne(
+                {"model_slug": slug},
+                {"$set": {**metadata, "updated_at": now}, "$setOnInsert": {"created_at": now}},
+                upsert=True
+            ))
+            # The multi-KB schema is only rewritten when its content changed
+            schema_update = self._schema_update(slug, schema)
+            operations.append(UpdateOne(
+                {"model_slug": slug, "schema_hash": {"$ne": schema_update["schema_hash"]}},
+                {"$set": schema_update}
+            ))
         
-        if result.upserted_id:
-            print("✅ Voice Cloning settings created successfully!")
-        else:
-            print("✅ Voice Cloning settings updated successfully!")
+        # Ordered so each document exists before its schema update runs
+        result = await self.settings_collection.bulk_write(operations, ordered=True)
         
-        return True
+        for index, settings_data in enumerate(settings_list):
+            action = "created" if 2 * index in result.upserted_ids else "updated"
+            logger.info(f"✅ {settings_data['model_name']} settings {action} successfully!")
     
     async def list_all_settings(self):
         """List all configured model settings"""
-        print("\n📋 Current Model Settings:")
-        print("=" * 50)
+        # Only the listed fields; the schema and layout subtrees stay on the server
+        cursor = self.settings_collection.find(
+            {"is_active": True},
+            projection={
+                "_id": 0,
+                "model_name": 1,
+                "model_slug": 1,
+                "version": 1,
+                "pricing.credits_per_use": 1,
+                "estimated_time": 1,
+                "updated_at": 1
+            }
+        ).sort("model_slug", 1)
+        all_settings = await cursor.to_list(length=None)
         
-        cursor = self.settings_collection.find({"is_active": True})
-        count = 0
+        # Built up front and emitted as one log record instead of a write per line
+        lines = ["\n📋 Current Model Settings:", "=" * 50]
+        for count, settings in enumerate(all_settings, start=1):
+            lines += [
+                f"{count}. {settings['model_name']} ({settings['model_slug']})",
+                f"   Version: {settings['version']}",
+                f"   Credits: {settings['pricing']['credits_per_use']}",
+                f"   Estimated Time: {settings['estimated_time']}",
+                f"   Last Updated: {settings['updated_at'].strftime('%Y-%m-%d %H:%M:%S')}",
+                "-" * 30
+            ]
         
-        async for settings in cursor:
-            count += 1
-            print(f"{count}. {settings['model_name']} ({settings['model_slug']})")
-            print(f"   Version: {settings['version']}")
-            print(f"   Credits: {settings['pricing']['credits_per_use']}")
-            print(f"   Estimated Time: {settings['estimated_time']}")
-            print(f"   Last Updated: {settings['updated_at'].strftime('%Y-%m-%d %H:%M:%S')}")
-            print("-" * 30)
-        
-        if count == 0:
-            print("No active model settings found.")
+        if not all_settings:
+            lines.append("No active model settings found.")
         else:
-            print(f"Total: {count} active model(s)")
+            lines.append(f"Total: {len(all_settings)} active model(s)")
+        
+        logger.info("\n".join(lines))
     
     async def cleanup(self):
         """Close MongoDB connection"""
         await MongoDB.close()
-        print("🔌 MongoDB connection closed")
+        logger.info("🔌 MongoDB connection closed")
+
+# Settings builder for each model slug; also drives the CLI choices
+_SETUP_FUNCS: Dict[str, Callable[[ModelSettingsSetup], Dict[str, Any]]] = {
+    "long-form-book": ModelSettingsSetup.setup_long_form_book_settings,
+    "audio-translation": ModelSettingsSetup.setup_audio_translation_settings,
+    "voice-cloning": ModelSettingsSetup.setup_voice_cloning_settings
+}
 
 # Main setup functions
-async def setup_all_models():
+async def setup_all_models(setup: ModelSettingsSetup):
     """Setup all AI model settings"""
-    setup = ModelSettingsSetup()
-    
     try:
-        await setup.initialize()
-        
-        # Setup all models
-        await setup.setup_long_form_book_settings()
-        await setup.setup_audio_translation_settings()
-        await setup.setup_voice_cloning_settings()
+        # Setup all models, stamped with one shared timestamp
+        now = datetime.utcnow()
+        await setup.upsert_settings([setup_func(setup) for setup_func in _SETUP_FUNCS.values()], now)
         
         # List all settings
         await setup.list_all_settings()
         
-        print("\n🎉 All model settings configured successfully!")
+        logger.info("\n🎉 All model settings configured successfully!")
         
     except Exception as e:
-        print(f"❌ Error setting up model settings: {e}")
+        logger.error(f"❌ Error setting up model settings: {e}")
         raise
-    finally:
-        await setup.cleanup()
 
-async def setup_single_model(model_slug: str):
+async def setup_single_model(setup: ModelSettingsSetup, model_slug: str):
     """Setup settings for a single model"""
-    setup = ModelSettingsSetup()
-    
     try:
-        await setup.initialize()
-        
-        if model_slug == "long-form-book":
-            await setup.setup_long_form_book_settings()
-        elif model_slug == "audio-translation":
-            await setup.setup_audio_translation_settings()
-        elif model_slug == "voice-cloning":
-            await setup.setup_voice_cloning_settings()
-        else:
-            print(f"❌ Unknown model slug: {model_slug}")
+        setup_func = _SETUP_FUNCS.get(model_slug)
+        if setup_func is None:
+            logger.error(f"❌ Unknown model slug: {model_slug}")
             return
         
-        print(f"🎉 {model_slug} settings configured successfully!")
+        await setup.upsert_settings([setup_func(setup)])
+        
+        logger.info(f"🎉 {model_slug} settings configured successfully!")
         
     except Exception as e:
-        print(f"❌ Error setting up {model_slug} settings: {e}")
+        logger.error(f"❌ Error setting up {model_slug} settings: {e}")
         raise
-    finally:
-        await setup.cleanup()
 
-async def list_models():
+async def list_models(setup: ModelSettingsSetup):
     """List all configured models"""
-    setup = ModelSettingsSetup()
-    
     try:
-        await setup.initialize()
         await setup.list_all_settings()
     except Exception as e:
-        print(f"❌ Error listing models: {e}")
+        logger.error(f"❌ Error listing models: {e}")
         raise
+
+async def main(action: str):
+    """Connect once, run the requested action and close the connection"""
+    setup = ModelSettingsSetup()
+    await setup.initialize()
+    
+    try:
+        if action == "all":
+            await setup_all_models(setup)
+        elif action == "list":
+            await list_models(setup)
+        else:
+            await setup_single_model(setup, action)
     finally:
         await setup.cleanup()
 
 if __name__ == "__main__":
     import argparse
     
+    # Run from the project root: python -m src.scripts.setup_model_settings all
     parser = argparse.ArgumentParser(description="Setup AI Model Settings")
     parser.add_argument(
         "action", 
-        choices=["all", "long-form-book", "audio-translation", "voice-cloning", "list"],
+        choices=["all", "list", *_SETUP_FUNCS],
         help="Action to perform"
     )
     
     args = parser.parse_args()
     
-    print("🚀 AI Model Settings Setup")
-    print("=" * 30)
+    # The config modules set up logging on import; replace it with plain console output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", force=True)
+    
+    logger.info("🚀 AI Model Settings Setup")
+    logger.info("=" * 30)
     
-    if args.action == "all":
-        asyncio.run(setup_all_models())
-    elif args.action == "list":
-        asyncio.run(list_models())
-    else:
-        asyncio.run(setup_single_model(args.action))
+    asyncio.run(main(args.action))
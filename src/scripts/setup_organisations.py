@@ -1,28 +1,47 @@
 import asyncio
 from src.config.mongodb import MongoDB
 from datetime import datetime
+from pymongo.errors import BulkWriteError
+
+DUPLICATE_KEY_ERROR = 11000
 
 async def setup_sample_organizations():
     """Setup sample organizations for testing"""
     organizations_collection = await MongoDB.get_collection("organizations")
     
+    # Organizations may have no domain, so uniqueness only applies where one is set
+    await organizations_collection.create_index(
+        "domain",
+        unique=True,
+        partialFilterExpression={"domain": {"$type": "string"}}
+    )
+    
+    now = datetime.utcnow()
     sample_orgs = [
         {
             "name": "RIMES",
             "domain": "rimes.int",
             "discount_percentage": 5.0,
             "is_active": True,
-            "created_at": datetime.utcnow()
+            "created_at": now
         }
     ]
     
-    for org in sample_orgs:
-        existing_org = await organizations_collection.find_one({"domain": org["domain"]})
-        if not existing_org:
-            result = await organizations_collection.insert_one(org)
-            print(f"Created organization: {org['name']} for domain {org['domain']} - ID: {result.inserted_id}")
-        else:
+    # One batch insert; the unique domain index rejects organizations that already exist
+    existing_indexes = set()
+    try:
+        await organizations_collection.insert_many(sample_orgs, ordered=False)
+    except BulkWriteError as e:
+        for error in e.details["writeErrors"]:
+            if error["code"] != DUPLICATE_KEY_ERROR:
+                raise
+            existing_indexes.add(error["index"])
+    
+    for index, org in enumerate(sample_orgs):
+        if index in existing_indexes:
             print(f"Organization already exists for domain: {org['domain']}")
+        else:
+            print(f"Created organization: {org['name']} for domain {org['domain']} - ID: {org['_id']}")
 
 if __name__ == "__main__":
     asyncio.run(setup_sample_organizations())
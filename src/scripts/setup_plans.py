@@ -1,314 +1,136 @@
 import asyncio
 from src.config.mongodb import MongoDB
-from datetime import datetime
+from datetime import datetime, timezone
+from pymongo import UpdateOne
+from typing import Any, Dict, Iterator, Optional
+
+# Fields identifying a plan; backed by a unique index
+PLAN_KEY_FIELDS = ("name", "currency", "billing_cycle")
+
+# Features of each tier, identical across currencies and billing cycles
+TIER_FEATURES = {
+    "Starter": {
+        "languages_supported": 3,
+        "voice_clones": 2,
+        "audio_processing_minutes": 100,
+        "text_to_speech": "basic",
+        "support": "standard",
+        "export_formats": ["MP3", "WAV"]
+    },
+    "Professional": {
+        "languages_supported": 20,
+        "voice_clones": 10,
+        "audio_processing_minutes": 500,
+        "text_to_speech": "advanced",
+        "video_generation": "10 videos/month",
+        "support": "priority",
+        "export_formats": ["All formats"],
+        "api_access": True,
+        "best_value": True
+    },
+    "Enterprise": {
+        "languages_supported": 50,
+        "voice_clones": "unlimited",
+        "audio_processing_minutes": "unlimited",
+        "text_to_speech": "premium",
+        "video_generation": "unlimited",
+        "support": "24/7 dedicated",
+        "white_label_solutions": True,
+        "sla_guarantee": True
+    }
+}
+
+TIER_DESCRIPTIONS = {
+    "Starter": "Perfect for individuals and small projects",
+    "Professional": "Ideal for content creators and businesses",
+    "Enterprise": "For large teams and organizations"
+}
+
+# Every plan comes with the same trial
+TRIAL_FEATURES = {
+    "free_trial_days": 7,
+    "no_credit_card_required": True
+}
+
+# (tier, currency, billing_cycle, price, credits, annual_savings)
+# Yearly plans get 12 months worth of credits
+PRICE_MATRIX = [
+    # USD Monthly Plans
+    ("Starter", "USD", "monthly", 9.0, 1000, None),
+    ("Professional", "USD", "monthly", 29.0, 3000, None),
+    ("Enterprise", "USD", "monthly", 99.0, 10000, None),
+    
+    # INR Monthly Plans
+    ("Starter", "INR", "monthly", 799.0, 1000, None),
+    ("Professional", "INR", "monthly", 1999.0, 3000, None),
+    ("Enterprise", "INR", "monthly", 4999.0, 10000, None),
+    
+    # USD Yearly Plans
+    ("Starter", "USD", "yearly", 89.0, 12000, 19),
+    ("Professional", "USD", "yearly", 290.0, 36000, 58),
+    ("Enterprise", "USD", "yearly", 990.0, 120000, 198),
+    
+    # INR Yearly Plans
+    ("Starter", "INR", "yearly", 7990.0, 12000, 1598),
+    ("Professional", "INR", "yearly", 19990.0, 36000, 3998),
+    ("Enterprise", "INR", "yearly", 49990.0, 120000, 9998)
+]
+
+def _plan_features(tier: str, annual_savings: Optional[int]) -> Dict[str, Any]:
+    """Features of a tier, with the yearly savings where there are any"""
+    savings = {"annual_savings": annual_savings} if annual_savings is not None else {}
+    return {**TIER_FEATURES[tier], **savings, **TRIAL_FEATURES}
+
+def _iter_plans(now: datetime) -> Iterator[Dict[str, Any]]:
+    """Yield each plan document from the price table"""
+    for tier, currency, billing_cycle, price, credits, annual_savings in PRICE_MATRIX:
+        yield {
+            "name": tier,
+            "description": TIER_DESCRIPTIONS[tier],
+            "price": price,
+            "currency": currency,
+            "billing_cycle": billing_cycle,
+            "credits": credits,
+            "features": _plan_features(tier, annual_savings),
+            "status": "active",
+            "created_at": now,
+            "updated_at": now
+        }
 
 async def setup_comprehensive_plans():
     """Setup all pricing plans based on frontend structure"""
     plans_collection = await MongoDB.get_collection("plans")
     
+    # The bulk upsert below relies on this index: it backs the per-plan lookup
+    # and keeps concurrent runs from inserting the same plan twice
+    await plans_collection.create_index(
+        [(field, 1) for field in PLAN_KEY_FIELDS],
+        unique=True
+    )
+    
     # Clear existing plans if you want to start fresh
     # await plans_collection.delete_many({})
     
-    plans = [
-        # USD Monthly Plans
-        {
-            "name": "Starter",
-            "description": "Perfect for individuals and small projects",
-            "price": 9.0,
-            "currency": "USD",
-            "billing_cycle": "monthly",
-            "credits": 1000,  # You can adjust credits based on your business logic
-            "features": {
-                "languages_supported": 3,
-                "voice_clones": 2,
-                "audio_processing_minutes": 100,
-                "text_to_speech": "basic",
-                "support": "standard",
-                "export_formats": ["MP3", "WAV"],
-                "free_trial_days": 7,
-                "no_credit_card_required": True
-            },
-            "status": "active",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "name": "Professional",
-            "description": "Ideal for content creators and businesses",
-            "price": 29.0,
-            "currency": "USD",
-            "billing_cycle": "monthly",
-            "credits": 3000,
-            "features": {
-                "languages_supported": 20,
-                "voice_clones": 10,
-                "audio_processing_minutes": 500,
-                "text_to_speech": "advanced",
-                "video_generation": "10 videos/month",
-                "support": "priority",
-                "export_formats": ["All formats"],
-                "api_access": True,
-                "best_value": True,
-                "free_trial_days": 7,
-                "no_credit_card_required": True
-            },
-            "status": "active",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "name": "Enterprise",
-            "description": "For large teams and organizations",
-            "price": 99.0,
-            "currency": "USD",
-            "billing_cycle": "monthly",
-            "credits": 10000,
-            "features": {
-                "languages_supported": 50,
-                "voice_clones": "unlimited",
-                "audio_processing_minutes": "unlimited",
-                "text_to_speech": "premium",
-                "video_generation": "unlimited",
-                "support": "24/7 dedicated",
-                "white_label_solutions": True,
-                "sla_guarantee": True,
-                "free_trial_days": 7,
-                "no_credit_card_required": True
-            },
-            "status": "active",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        
-        # INR Monthly Plans
-        {
-            "name": "Starter",
-            "description": "Perfect for individuals and small projects",
-            "price": 799.0,
-            "currency": "INR",
-            "billing_cycle": "monthly",
-            "credits": 1000,
-            "features": {
-                "languages_supported": 3,
-                "voice_clones": 2,
-                "audio_processing_minutes": 100,
-                "text_to_speech": "basic",
-                "support": "standard",
-                "export_formats": ["MP3", "WAV"],
-                "free_trial_days": 7,
-                "no_credit_card_required": True
-            },
-            "status": "active",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "name": "Professional",
-            "description": "Ideal for content creators and businesses",
-            "price": 1999.0,
-            "currency": "INR",
-            "billing_cycle": "monthly",
-            "credits": 3000,
-            "features": {
-                "languages_supported": 20,
-                "voice_clones": 10,
-                "audio_processing_minutes": 500,
-                "text_to_speech": "advanced",
-                "video_generation": "10 videos/month",
-                "support": "priority",
-                "export_formats": ["All formats"],
-                "api_access": True,
-                "best_value": True,
-                "free_trial_days": 7,
-                "no_credit_card_required": True
-            },
-            "status": "active",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "name": "Enterprise",
-            "description": "For large teams and organizations",
-            "price": 4999.0,
-            "currency": "INR",
-            "billing_cycle": "monthly",
-            "credits": 10000,
-            "features": {
-                "languages_supported": 50,
-                "voice_clones": "unlimited",
-                "audio_processing_minutes": "unlimited",
-                "text_to_speech": "premium",
-                "video_generation": "unlimited",
-                "support": "24/7 dedicated",
-                "white_label_solutions": True,
-                "sla_guarantee": True,
-                "free_trial_days": 7,
-                "no_credit_card_required": True
-            },
-            "status": "active",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        
-        # USD Yearly Plans
-        {
-            "name": "Starter",
-            "description": "Perfect for individuals and small projects",
-            "price": 89.0,
-            "currency": "USD",
-            "billing_cycle": "yearly",
-            "credits": 12000,  # 12 months worth
-            "features": {
-                "languages_supported": 3,
-                "voice_clones": 2,
-                "audio_processing_minutes": 100,
-                "text_to_speech": "basic",
-                "support": "standard",
-                "export_formats": ["MP3", "WAV"],
-                "annual_savings": 19,
-                "free_trial_days": 7,
-                "no_credit_card_required": True
-            },
-            "status": "active",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "name": "Professional",
-            "description": "Ideal for content creators and businesses",
-            "price": 290.0,
-            "currency": "USD",
-            "billing_cycle": "yearly",
-            "credits": 36000,  # 12 months worth
-            "features": {
-                "languages_supported": 20,
-                "voice_clones": 10,
-                "audio_processing_minutes": 500,
-                "text_to_speech": "advanced",
-                "video_generation": "10 videos/month",
-                "support": "priority",
-                "export_formats": ["All formats"],
-                "api_access": True,
-                "best_value": True,
-                "annual_savings": 58,
-                "free_trial_days": 7,
-                "no_credit_card_required": True
-            },
-            "status": "active",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "name": "Enterprise",
-            "description": "For large teams and organizations",
-            "price": 990.0,
-            "currency": "USD",
-            "billing_cycle": "yearly",
-            "credits": 120000,  # 12 months worth
-            "features": {
-                "languages_supported": 50,
-                "voice_clones": "unlimited",
-                "audio_processing_minutes": "unlimited",
-                "text_to_speech": "premium",
-                "video_generation": "unlimited",
-                "support": "24/7 dedicated",
-                "white_label_solutions": True,
-                "sla_guarantee": True,
-                "annual_savings": 198,
-                "free_trial_days": 7,
-                "no_credit_card_required": True
-            },
-            "status": "active",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        
-        # INR Yearly Plans
-        {
-            "name": "Starter",
-            "description": "Perfect for individuals and small projects",
-            "price": 7990.0,
-            "currency": "INR",
-            "billing_cycle": "yearly",
-            "credits": 12000,
-            "features": {
-                "languages_supported": 3,
-                "voice_clones": 2,
-                "audio_processing_minutes": 100,
-                "text_to_speech": "basic",
-                "support": "standard",
-                "export_formats": ["MP3", "WAV"],
-                "annual_savings": 1598,
-                "free_trial_days": 7,
-                "no_credit_card_required": True
-            },
-            "status": "active",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "name": "Professional",
-            "description": "Ideal for content creators and businesses",
-            "price": 19990.0,
-            "currency": "INR",
-            "billing_cycle": "yearly",
-            "credits": 36000,
-            "features": {
-                "languages_supported": 20,
-                "voice_clones": 10,
-                "audio_processing_minutes": 500,
-                "text_to_speech": "advanced",
-                "video_generation": "10 videos/month",
-                "support": "priority",
-                "export_formats": ["All formats"],
-                "api_access": True,
-                "best_value": True,
-                "annual_savings": 3998,
-                "free_trial_days": 7,
-                "no_credit_card_required": True
-            },
-            "status": "active",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "name": "Enterprise",
-            "description": "For large teams and organizations",
-            "price": 49990.0,
-            "currency": "INR",
-            "billing_cycle": "yearly",
-            "credits": 120000,
-            "features": {
-                "languages_supported": 50,
-                "voice_clones": "unlimited",
-                "audio_processing_minutes": "unlimited",
-                "text_to_speech": "premium",
-                "video_generation": "unlimited",
-                "support": "24/7 dedicated",
-                "white_label_solutions": True,
-                "sla_guarantee": True,
-                "annual_savings": 9998,
-                "free_trial_days": 7,
-                "no_credit_card_required": True
-            },
-            "status": "active",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        }
-    ]
+    # One timestamp shared by every plan in this run
+    now = datetime.now(timezone.utc)
+    
+    # Identity filter built once per plan; it is both the upsert key and the printed identifier
+    plan_keys = []
+    operations = []
+    for plan in _iter_plans(now):
+        plan_key = {field: plan[field] for field in PLAN_KEY_FIELDS}
+        plan_keys.append(plan_key)
+        # $setOnInsert leaves plans that already exist untouched
+        operations.append(UpdateOne(plan_key, {"$setOnInsert": plan}, upsert=True))
     
-    for plan in plans:
+    # One round trip for all plans
+    result = await plans_collection.bulk_write(operations, ordered=False)
+    
+    for index, plan_key in enumerate(plan_keys):
         # Create unique identifier for each plan combination
-        plan_identifier = f"{plan['name']}_{plan['currency']}_{plan['billing_cycle']}"
-        
-        existing_plan = await plans_collection.find_one({
-            "name": plan["name"],
-            "currency": plan["currency"],
-            "billing_cycle": plan["billing_cycle"]
-        })
+        plan_identifier = "_".join(plan_key.values())
         
-        if not existing_plan:
-            await plans_collection.insert_one(plan)
+        if index in result.upserted_ids:
             print(f"Created plan: {plan_identifier}")
         else:
             print(f"Plan already exists: {plan_identifier}")
@@ -0,0 +1,90 @@
+"""Helpers shared by the long-form book generation scripts"""
+import os
+import re
+from dataclasses import dataclass, fields
+from typing import Dict
+import orjson
+
+# A structure line is a chapter title if it starts with "chapter N" (any case) or
+# mentions "Chapter"; otherwise numbered (1.) and bulleted (- or •) lines are sections
+STRUCTURE_LINE_RE = re.compile(
+    r'^\s*(?:'
+    r'(?P<chapter>(?i:chapter[^\S\n]+\d+)[^\n]*?|[^\n]*Chapter[^\n]*?)'
+    r'|(?:\d+\.|[-•])[^\S\n]*(?P<section>[^\n]*?)'
+    r')[^\S\n]*$',
+    re.M
+)
+
+@dataclass
+class BookSettings:
+    """Enhanced class to hold all book configuration settings"""
+    concept: str
+    genre: str
+    target_audience: str
+    book_length: str
+    tone: str
+    complexity: str
+    perspective: str
+    chapters_count: int = 10
+    sections_per_chapter: int = 6
+    pages_per_section: int = 3
+    include_toc: bool = True
+    include_chapters: bool = True
+    include_images: bool = True
+    include_bibliography: bool = True
+    include_index: bool = False
+    include_appendix: bool = False
+    author_name: str = "AI Generated"
+    book_title: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'BookSettings':
+        """Build settings from a config mapping, ignoring unknown keys"""
+        return cls(**{field.name: data[field.name] for field in fields(cls) if field.name in data})
+
+class StreamedStory(list):
+    """List of flowables that pulls from a generator as reportlab consumes it
+
+    doc.build() pops flowables off the front of a list, so keeping only a short
+    lookahead window in the list bounds memory by page rather than by book.
+    """
+
+    def __init__(self, flowables, lookahead: int = 64):
+        super().__init__()
+        self._flowables = iter(flowables)
+        self._lookahead = lookahead
+        self._fill()
+
+    def _fill(self):
+        while super().__len__() < self._lookahead:
+            try:
+                super().append(next(self._flowables))
+            except StopIteration:
+                break
+
+    def __len__(self):
+        self._fill()
+        return super().__len__()
+
+    def __getitem__(self, index):
+        self._fill()
+        return super().__getitem__(index)
+
+def write_atomic(filename: str, data: bytes):
+    """Write a temp file and swap it in, so a crash never leaves a truncated save"""
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_filename, filename)
+
+def append_chapter_log(filename: str, chapter_number: int, chapter_data: Dict):
+    """Append one finished chapter to an NDJSON progress log
+
+    Progress then costs one chapter per write instead of re-serializing the
+    whole book.
+    """
+    try:
+        with open(filename, 'ab') as f:
+            f.write(orjson.dumps({'chapter': chapter_number, **chapter_data}) + b'\n')
+    except Exception as e:
+        print(f"Error saving chapter {chapter_number} progress: {e}")
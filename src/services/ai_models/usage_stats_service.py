@@ -0,0 +1,95 @@
+from src.config.mongodb import MongoDB
+from src.utils.cache import SingleFlight, TTLCache
+from typing import Dict, Any, Optional
+from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_MODEL_SLUG = "unknown"
+UNKNOWN_STATUS = "unknown"
+
+class UsageStatsService:
+    """Per-user usage stats kept in user_usage_stats alongside ai_usage_history writes"""
+
+    # Stats are read far more often than they change
+    _cache = TTLCache(ttl=60)
+    _flight = SingleFlight()
+
+    @staticmethod
+    def _status_inc(slug: Optional[str], status: Optional[str], count: int, credits: float) -> Dict[str, Any]:
+        """Build $inc paths for one status bucket of a model"""
+        prefix = f"models.{slug or UNKNOWN_MODEL_SLUG}.by_status.{status or UNKNOWN_STATUS}"
+        return {f"{prefix}.count": count, f"{prefix}.credits": credits}
+
+    @classmethod
+    async def record_created(cls, user_id: str, slug: Optional[str], status: str, credits: float):
+        """Count a newly created usage record"""
+        prefix = f"models.{slug or UNKNOWN_MODEL_SLUG}"
+        inc = {
+            f"{prefix}.total_usage": 1,
+            f"{prefix}.total_credits": credits,
+            **cls._status_inc(slug, status, 1, credits)
+        }
+
+        # Existing history is backfilled by scripts/backfill_usage_stats.py before
+        # this goes live, so a missing document means the user's first record
+        stats_collection = await MongoDB.get_collection("user_usage_stats")
+        await stats_collection.update_one(
+            {"user_id": user_id},
+            {"$inc": inc, "$set": {"updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+        cls._cache.invalidate(user_id)
+
+    @classmethod
+    async def record_transition(cls, previous: Optional[Dict[str, Any]], status: str):
+        """Move a usage record between status buckets, given the record as it was before the update"""
+        if not previous or previous.get("status") == status:
+            return
+
+        slug = previous.get("ai_model_slug")
+        credits = previous.get("credits_used", 0)
+        inc = {
+            **cls._status_inc(slug, previous.get("status"), -1, -credits),
+            **cls._status_inc(slug, status, 1, credits)
+        }
+
+        stats_collection = await MongoDB.get_collection("user_usage_stats")
+        await stats_collection.update_one(
+            {"user_id": previous["user_id"]},
+            {"$inc": inc, "$set": {"updated_at": datetime.utcnow()}}
+        )
+        cls._cache.invalidate(previous["user_id"])
+
+    @classmethod
+    async def get_stats(cls, user_id: str) -> Dict[str, Any]:
+        """Get a user's stats keyed by model slug"""
+        cached = cls._cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        # Concurrent cache misses for the same user share one read
+        return await cls._flight.do(user_id, lambda: cls._load_stats(user_id))
+
+    @classmethod
+    async def _load_stats(cls, user_id: str) -> Dict[str, Any]:
+        """Read the materialized stats; a user with no usage yet has none"""
+        stats_collection = await MongoDB.get_collection("user_usage_stats")
+        doc = await stats_collection.find_one({"user_id": user_id}, {"models": 1})
+        models = doc.get("models", {}) if doc else {}
+
+        # Buckets a record has moved out of stay behind with a zero count
+        stats = {
+            slug: {
+                "total_usage": model["total_usage"],
+                "total_credits": model["total_credits"],
+                "by_status": {
+                    status: bucket for status, bucket in model.get("by_status", {}).items()
+                    if bucket["count"]
+                }
+            }
+            for slug, model in models.items()
+        }
+        cls._cache.set(user_id, stats)
+        return stats
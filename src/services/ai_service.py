@@ -105,13 +105,12 @@ class AIService:
             conversation_text += f"Human: {message}\nAssistant: "
             
             # Generate response with streaming
-            response = await asyncio.to_thread(
-                self.model.generate_content,
+            response = await self.model.generate_content_async(
                 conversation_text,
                 stream=True
             )
             
-            for chunk in response:
+            async for chunk in response:
                 if chunk.text:
                     yield chunk.text
                     
@@ -0,0 +1,5 @@
+class BadRequestError(ValueError):
+    """The request is invalid and the message is safe to show the caller"""
+
+class NotFoundError(ValueError):
+    """A requested record does not exist or is not visible to the caller"""
@@ -0,0 +1,24 @@
+from hashlib import blake2b
+from typing import Any
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+import orjson
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison"""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+def conditional_json_response(request: Request, content: Any, cache_control: str) -> Response:
+    """Serialize content with an ETag and answer 304 when the client already has it"""
+    body = orjson.dumps(jsonable_encoder(content))
+    etag = f'"{blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,35 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from bson import ObjectId
+from bson.errors import InvalidId
+from src.utils.errors import BadRequestError
+
+def encode_cursor(value: datetime, doc_id: Any) -> str:
+    """Encode the sort key of the last document on a page into an opaque cursor"""
+    payload = [value.isoformat(), str(doc_id), isinstance(doc_id, ObjectId)]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, Any]:
+    """Decode a cursor produced by encode_cursor, raising BadRequestError if it is malformed"""
+    try:
+        value, doc_id, is_object_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(value), ObjectId(doc_id) if is_object_id else doc_id
+    except (binascii.Error, ValueError, TypeError, InvalidId) as e:
+        raise BadRequestError("Invalid pagination cursor") from e
+
+def keyset_filter(field: str, cursor: Optional[str]) -> Dict[str, Any]:
+    """Build the range filter selecting documents after the cursor in descending order"""
+    if not cursor:
+        return {}
+    value, doc_id = decode_cursor(cursor)
+    return {"$or": [
+        {field: {"$lt": value}},
+        {field: value, "_id": {"$lt": doc_id}}
+    ]}
+
+def keyset_sort(field: str) -> List[Tuple[str, int]]:
+    """Sort order matching keyset_filter, with _id breaking ties"""
+    return [(field, -1), ("_id", -1)]
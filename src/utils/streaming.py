@@ -0,0 +1,57 @@
+import json
+import logging
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Optional
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Marks an iterator that was exhausted before its first row
+_EMPTY = object()
+
+async def _envelope_chunks(
+    first: Any,
+    rows: AsyncIterator[BaseModel],
+    message: str,
+    status: int,
+    trailer: Optional[Callable[[], Dict[str, Any]]]
+) -> AsyncIterator[bytes]:
+    """Yield the standard response envelope with each data row encoded as it arrives"""
+    head = json.dumps({"status": status, "success": True, "message": message})
+    yield head[:-1].encode() + b', "data": ['
+    if first is not _EMPTY:
+        yield first.model_dump_json(by_alias=True).encode()
+        try:
+            async for row in rows:
+                yield b"," + row.model_dump_json(by_alias=True).encode()
+        except Exception:
+            # The status line is already sent, so close the envelope with an
+            # error marker rather than leaving the client a truncated body
+            logger.exception(f"List stream failed after the first row: {message}")
+            yield b'], "error": "Stream interrupted"}'
+            return
+    yield b"]"
+    if trailer:
+        # Fields only known once every row has been read, e.g. next_cursor
+        for key, value in trailer().items():
+            yield f", {json.dumps(key)}: {json.dumps(value)}".encode()
+    yield b"}"
+
+async def stream_list_response(
+    rows: AsyncIterable[BaseModel],
+    message: str,
+    status: int = 200,
+    trailer: Optional[Callable[[], Dict[str, Any]]] = None
+) -> StreamingResponse:
+    """Stream a list envelope using chunked transfer instead of buffering every row
+
+    The first row is read before the response is built, so a failing query
+    still raises through the app exception handlers instead of a 200.
+    """
+    iterator = aiter(rows)
+    first = await anext(iterator, _EMPTY)
+    return StreamingResponse(
+        _envelope_chunks(first, iterator, message, status, trailer),
+        status_code=status,
+        media_type="application/json"
+    )
@@ -0,0 +1,7 @@
+from typing import Annotated
+from fastapi import Path
+
+# Hex form of a BSON ObjectId, for rejecting malformed path IDs before any query
+OBJECT_ID_PATTERN = r"^[0-9a-fA-F]{24}$"
+
+ObjectIdPath = Annotated[str, Path(pattern=OBJECT_ID_PATTERN)]